@@ -1,15 +1,43 @@
+import importlib
+import sys
 import warnings
 
-try:
-    from .LowLevel import API
-    from .APIError import *
-    from .Parameters import *
-    from . import JLink
-except Exception:
-    import LowLevel.API as API
-    from APIError import *
-    from Parameters import *
-    import JLink
 
-warnings.warn("API module will be deprecated in version 11, use LowLevel module instead.", PendingDeprecationWarning)
+def _load():
+    """
+    Imports the modules re-exported by this deprecated module. Done on first attribute access (PEP 562) so that
+    importing it stays cheap. __all__ is only defined here, so that star imports also trigger the load.
+    """
+    package = __package__ or None
+    prefix = '.' if package else ''
+
+    namespace = {}
+    for module_name in ('APIError', 'Parameters'):
+        module = importlib.import_module(prefix + module_name, package)
+        namespace.update((name, getattr(module, name)) for name in dir(module) if not name.startswith('_'))
+
+    namespace['API'] = importlib.import_module(prefix + 'LowLevel', package).API
+    namespace['JLink'] = importlib.import_module(prefix + 'JLink', package)
+    namespace['__all__'] = sorted(namespace)
+    globals().update(namespace)
+
+
+def __getattr__(name):
+    if 'API' not in globals():
+        _load()
+        if name in globals():
+            return globals()[name]
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
 
+
+def __dir__():
+    if 'API' not in globals():
+        _load()
+    return sorted(globals())
+
+
+# Module level __getattr__ is only supported from Python 3.7.
+if sys.version_info < (3, 7):
+    _load()
+
+warnings.warn("API module will be deprecated in version 11, use LowLevel module instead.", PendingDeprecationWarning)
@@ -70,6 +70,11 @@ class NrfjprogdllErr(enum.IntEnum):
     INTERNAL_ERROR                              = -254
     NOT_IMPLEMENTED_ERROR                       = -255
 
+
+_NRFJPROG_ERR_CODES = frozenset(member.value for member in NrfjprogdllErr)
+_NRFJPROG_ERR_NAMES = {member.value: member.name for member in NrfjprogdllErr}
+
+
 class APIError(Exception):
     """
     pynrfjprog DLL exception class, inherits from the built-in Exception class.
@@ -85,8 +90,8 @@ class APIError(Exception):
 
         self.err_code = err_code
         self.err_msg = err_msg
-        self.error_enum = NrfjprogdllErr(err_code)
-        self.err_str = 'An error was reported by NRFJPROG DLL: {} {}. {}'.format(self.err_code, self.error_enum .name, err_msg).rstrip()
+        self.error_enum = NrfjprogdllErr(err_code) if err_code in _NRFJPROG_ERR_CODES else None
+        self.err_str = 'An error was reported by NRFJPROG DLL: {} {}. {}'.format(self.err_code, _NRFJPROG_ERR_NAMES.get(err_code, 'UNKNOWN_ERROR'), err_msg).rstrip()
 
         if error_data:
             error_data = " \n" + ("\n\textra: ".join(error_data))
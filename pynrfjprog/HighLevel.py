@@ -9,6 +9,7 @@ from __future__ import print_function
 import codecs
 import ctypes
 import os
+import sys
 import logging
 import weakref
 from pathlib import Path
@@ -32,16 +33,113 @@ Logging:
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 QSPIIniFile = Path(__file__).parent / "QspiDefault.ini"
 
+"""
+Location of the highlevelnrfjprog DLL shipped with the package, resolved once at import time.
+"""
+if sys.maxsize > 2 ** 32:
+    _HIGHLEVEL_DLL_FOLDER = 'lib_x64'
+else:
+    _HIGHLEVEL_DLL_FOLDER = 'lib_x86'
+
+_os_name = sys.platform.lower()
+
+if _os_name.startswith('win'):
+    _HIGHLEVEL_DLL_NAME = 'highlevelnrfjprog.dll'
+elif _os_name.startswith('lin'):
+    _HIGHLEVEL_DLL_NAME = 'libhighlevelnrfjprog.so'
+elif _os_name.startswith('dar'):
+    _HIGHLEVEL_DLL_NAME = 'libhighlevelnrfjprog.dylib'
+else:
+    _HIGHLEVEL_DLL_NAME = None  # Unsupported OS, reported when API is instantiated.
+
+_HIGHLEVEL_DLL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), _HIGHLEVEL_DLL_FOLDER,
+                                   _HIGHLEVEL_DLL_NAME or '')
+
+# Plain int so that checking DLL results does not go through IntEnum comparison.
+_SUCCESS = int(NrfjprogdllErr.SUCCESS)
+_byref = ctypes.byref
+
+# Default options shared by all probes. They are passed to the DLL by value and never modified.
+_DEFAULT_PROGRAM_OPTIONS = ProgramOptions()
+_DEFAULT_READ_OPTIONS = ReadOptions(readcode=True)
+_DEFAULT_QSPI_INIT_PARAMS = QSPIInitParams()
+
+
+"""
+Function prototypes of the highlevelnrfjprog DLL, see highlevelnrfjprogdll.h. All functions except NRFJPROG_dll_close
+return nrfjprogdll_err_t. Declaring them up front lets ctypes convert the arguments without guessing their types on
+every call.
+"""
+_handle = ctypes.c_void_p
+_handle_p = ctypes.POINTER(ctypes.c_void_p)
+_u8 = ctypes.c_uint8
+_u8_p = ctypes.POINTER(ctypes.c_uint8)
+_u32 = ctypes.c_uint32
+_u32_p = ctypes.POINTER(ctypes.c_uint32)
+_bool_p = ctypes.POINTER(ctypes.c_bool)
+_enum = ctypes.c_int
+_enum_p = ctypes.POINTER(ctypes.c_int)
+_str = ctypes.c_char_p
+_cb = ctypes.c_void_p  # msg_callback * or msg_callback_ex *, a CFUNCTYPE instance or None.
+
+_HIGHLEVEL_PROTOTYPES = {
+    'NRFJPROG_dll_version':                     [_u32_p, _u32_p, _u32_p],
+    'NRFJPROG_dll_open_ex':                     [_str, _cb, ctypes.c_void_p],
+    'NRFJPROG_dll_close':                       [],
+    'NRFJPROG_is_dll_open':                     [_bool_p],
+    'NRFJPROG_get_connected_probes':            [_u32_p, _u32, _u32_p],
+    'NRFJPROG_probe_init_ex':                   [_handle_p, _cb, _cb, ctypes.c_void_p, _u32, _u32, _str],
+    'NRFJPROG_dfu_init_ex':                     [_handle_p, _cb, _cb, ctypes.c_void_p, _u32, _u32, _enum, _str],
+    'NRFJPROG_mcuboot_dfu_init_ex':             [_handle_p, _cb, _cb, ctypes.c_void_p, _str, _u32, _u32],
+    'NRFJPROG_modemdfu_dfu_serial_init_ex':     [_handle_p, _cb, _cb, ctypes.c_void_p, _str, _u32, _u32],
+    'NRFJPROG_probe_uninit':                    [_handle_p],
+    'NRFJPROG_probe_reset':                     [_handle],
+    'NRFJPROG_probe_replace_fw':                [_handle],
+    'NRFJPROG_probe_setup_qspi':                [_handle, _u32, QSPIInitParams],
+    'NRFJPROG_probe_setup_qspi_ini':            [_handle, _str],
+    'NRFJPROG_probe_set_coprocessor':           [_handle, _enum],
+    'NRFJPROG_get_library_info':                [_handle, ctypes.POINTER(LibraryInfoStruct)],
+    'NRFJPROG_get_probe_info':                  [_handle, ctypes.POINTER(ProbeInfoStruct)],
+    'NRFJPROG_get_device_info':                 [_handle, ctypes.POINTER(DeviceInfoStruct)],
+    'NRFJPROG_get_readback_protection':         [_handle, _enum_p],
+    'NRFJPROG_readback_protect':                [_handle, _enum],
+    'NRFJPROG_is_eraseprotect_enabled':         [_handle, _bool_p],
+    'NRFJPROG_enable_eraseprotect':             [_handle],
+    'NRFJPROG_program':                         [_handle, _str, ProgramOptions],
+    'NRFJPROG_read_to_file':                    [_handle, _str, ReadOptions],
+    'NRFJPROG_verify':                          [_handle, _str, _enum],
+    'NRFJPROG_erase':                           [_handle, _enum, _u32, _u32],
+    'NRFJPROG_recover':                         [_handle],
+    'NRFJPROG_read':                            [_handle, _u32, _u8_p, _u32],
+    'NRFJPROG_read_u32':                        [_handle, _u32, _u32_p],
+    'NRFJPROG_write':                           [_handle, _u32, _u8_p, _u32],
+    'NRFJPROG_write_u32':                       [_handle, _u32, _u32],
+    'NRFJPROG_reset':                           [_handle, _enum],
+    'NRFJPROG_run':                             [_handle, _u32, _u32],
+    'NRFJPROG_is_rtt_started':                  [_handle, _bool_p],
+    'NRFJPROG_rtt_set_control_block_address':   [_handle, _u32],
+    'NRFJPROG_rtt_start':                       [_handle],
+    'NRFJPROG_rtt_is_control_block_found':      [_handle, _bool_p],
+    'NRFJPROG_rtt_stop':                        [_handle],
+    'NRFJPROG_rtt_read':                        [_handle, _u32, _u8_p, _u32, _u32_p],
+    'NRFJPROG_rtt_write':                       [_handle, _u32, _str, _u32, _u32_p],
+    'NRFJPROG_rtt_read_channel_count':          [_handle, _u32_p, _u32_p],
+    'NRFJPROG_rtt_read_channel_info':           [_handle, _u32, _enum, _u8_p, _u32, _u32_p],
+}
+
+_HIGHLEVEL_RESTYPES = {
+    'NRFJPROG_dll_close':                       None,
+}
+
 
 class API(object):
     """
     API model based on the HighLevel DLL.
     Provides a high level, but still C-like API for J-Link debuggers targeting nRF devices.
     Root class of the module. Instance the class to get access to highlevel nrfjprog.dll functions in Python.
-    """
 
-    # List of generated probes to make sure their python objects survive to self.close() if neccessary.
-    probes = list()
+    Note: An instance reuses internal buffers between calls and must not be used from several threads at once.
+    """
 
     def __init__(self, log=True):
         """
@@ -53,31 +151,28 @@ class API(object):
         _logger = logging.getLogger(__name__)
         self._logger = Parameters.LoggerAdapter(_logger, None, log=log)
 
-        this_dir, this_file = os.path.split(__file__)
+        # Generated probes, to make sure their python objects survive to self.close() if neccessary. A dict keeps
+        # registration order with constant time deregistration, see the probes property.
+        self._probes = {}
 
-        if sys.maxsize > 2 ** 32:
-            libfolder = 'lib_x64'
-        else:
-            libfolder = 'lib_x86'
+        # Output buffers reused by get_connected_probes and is_open. The DLL only writes them, so they are never cleared.
+        self._serial_numbers = (_u32 * 127)()
+        self._num_available = _u32()
+        self._is_opened = ctypes.c_bool()
 
-        os_name = sys.platform.lower()
+        # Set by open and cleared by close. Lets Probe.close skip the DLL query of is_open.
+        self._is_open = False
 
-        if os_name.startswith('win'):
-            highlevel_nrfjprog_dll_name = 'highlevelnrfjprog.dll'
-        elif os_name.startswith('lin'):
-            highlevel_nrfjprog_dll_name = 'libhighlevelnrfjprog.so'
-        elif os_name.startswith('dar'):
-            highlevel_nrfjprog_dll_name = 'libhighlevelnrfjprog.dylib'
-        else:
+        if _HIGHLEVEL_DLL_NAME is None:
             raise Exception('Unsupported operating system!')
 
-        highlevel_nrfjprog_dll_path = os.path.join(os.path.abspath(this_dir), libfolder, highlevel_nrfjprog_dll_name)
+        highlevel_nrfjprog_dll_path = _HIGHLEVEL_DLL_PATH
 
         if not os.path.exists(highlevel_nrfjprog_dll_path):
             raise APIError(NrfjprogdllErr.NRFJPROG_SUB_DLL_NOT_FOUND, highlevel_nrfjprog_dll_path, log=self._logger.error)
 
         try:
-            self.lib = ctypes.cdll.LoadLibrary(highlevel_nrfjprog_dll_path)
+            self.lib = load_library(highlevel_nrfjprog_dll_path, _HIGHLEVEL_PROTOTYPES, _HIGHLEVEL_RESTYPES)
         except Exception as ex:
             raise APIError(NrfjprogdllErr.NRFJPROG_SUB_DLL_COULD_NOT_BE_OPENED, 'Got error {} for library at {}'.format(repr(ex), highlevel_nrfjprog_dll_path), log=self._logger.error)
 
@@ -95,40 +190,35 @@ class API(object):
 
         @return (int, int, int): Tuple containing the major, minor and micro version of the DLL.
         """
-        major = ctypes.c_uint32(0)
-        minor = ctypes.c_uint32(0)
-        micro = ctypes.c_uint32(0)
+        major = _u32(0)
+        minor = _u32(0)
+        micro = _u32(0)
 
-        result = self.lib.NRFJPROG_dll_version(ctypes.byref(major), ctypes.byref(minor), ctypes.byref(micro))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self.lib.NRFJPROG_dll_version(_byref(major), _byref(minor), _byref(micro)))
 
         return major.value, minor.value, micro.value
 
     def open(self):
-        result = self.lib.NRFJPROG_dll_open_ex(None, self._logger.log_cb, None)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self.lib.NRFJPROG_dll_open_ex(None, self._logger.log_cb, self._logger.log_param))
+        self._is_open = True
 
         # Make sure that api is closed before api is destroyed
         self._finalizer = weakref.finalize(self, self.close)
 
     def close(self):
         self.lib.NRFJPROG_dll_close()
+        self._is_open = False
 
-        # List.clear is not available in Python 2.7. Manually delete all elements in list instead.
-        del self.probes[:]
+        self._probes.clear()
 
         # Disable the api finalizer, as it's no longer necessary when the api is closed.
         self._finalizer.detach()
 
     def is_open(self):
 
-        is_opened = ctypes.c_bool(False)
+        is_opened = self._is_opened
 
-        result = self.lib.NRFJPROG_is_dll_open(ctypes.byref(is_opened))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self.lib.NRFJPROG_is_dll_open(_byref(is_opened)))
 
         return is_opened.value
 
@@ -141,25 +231,40 @@ class API(object):
         """
         return self._logger.get_errors()
 
-    def get_connected_probes(self):
-        serial_numbers_len = ctypes.c_uint32(127)
-        serial_numbers = (ctypes.c_uint32 * serial_numbers_len.value)(0)
-        num_available = ctypes.c_uint32(0)
+    def _check(self, result):
+        """
+        Raises an APIError carrying the logged DLL errors if result is not NrfjprogdllErr.SUCCESS.
 
-        result = self.lib.NRFJPROG_get_connected_probes(ctypes.byref(serial_numbers), serial_numbers_len, ctypes.byref(num_available))
-        if result != NrfjprogdllErr.SUCCESS:
+        @param int result: Return value of a highlevelnrfjprog DLL function.
+        """
+        if result != _SUCCESS:
             raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
 
-        snr = [int(serial_numbers[i]) for i in range(0, min(num_available.value, serial_numbers_len.value))]
+    def get_connected_probes(self):
+        serial_numbers = self._serial_numbers
+        serial_numbers_len = len(serial_numbers)
+        num_available = self._num_available
+
+        self._check(self.lib.NRFJPROG_get_connected_probes(serial_numbers, serial_numbers_len, _byref(num_available)))
+
+        snr = serial_numbers[0:min(num_available.value, serial_numbers_len)]
 
         return snr
 
     def register_probe(self, probe):
-        self.probes.append(probe)
+        self._probes[probe] = None
 
     def deregister_probe(self, probe):
-        if probe in self.probes:
-            self.probes.remove(probe)
+        self._probes.pop(probe, None)
+
+    @property
+    def probes(self):
+        """
+        Probes registered with this API, in registration order.
+
+        @return [Probe]: Copy of the registered probes, modifying it does not register or deregister probes.
+        """
+        return list(self._probes)
 
     def __enter__(self):
         """
@@ -181,6 +286,8 @@ class Probe(object):
     """
     Abstract object model based on the HighLevel DLL API, targeting one probe at a time.
     Provides a "pythonic" API for J-Link debuggers targeting nRF devices.
+
+    Note: An instance reuses internal buffers between calls and must not be used from several threads at once.
     """
 
     def __init__(self, api, log, logger_id):
@@ -195,13 +302,37 @@ class Probe(object):
         if not api.is_open():
             raise APIError(NrfjprogdllErr.INVALID_OPERATION, "Provided API is not open")
 
-        self._program_options = ProgramOptions()
-        self._read_options = ReadOptions(readcode=True)
-        self._qspi_ini_params = QSPIInitParams()
+        self._program_options = _DEFAULT_PROGRAM_OPTIONS
+        self._read_options = _DEFAULT_READ_OPTIONS
+        self._qspi_ini_params = _DEFAULT_QSPI_INIT_PARAMS
 
         self._api = api
         self._handle = None
 
+        # Memory access and RTT transfers are called in tight loops, keep the typed functions at hand.
+        self._read = api.lib.NRFJPROG_read
+        self._read_u32 = api.lib.NRFJPROG_read_u32
+        self._write = api.lib.NRFJPROG_write
+        self._write_u32 = api.lib.NRFJPROG_write_u32
+        self._rtt_read = api.lib.NRFJPROG_rtt_read
+        self._rtt_write = api.lib.NRFJPROG_rtt_write
+
+        # Output values of the bool, enum and single word getters, reused between calls.
+        self._bool_out = ctypes.c_bool()
+        self._enum_out = ctypes.c_int()
+        self._u32_out = _u32()
+
+        # Down and up channel counts written by rtt_read_channel_count, reused between calls.
+        self._rtt_down_channel_count = _u32()
+        self._rtt_up_channel_count = _u32()
+
+        # Channel name buffer written by rtt_read_channel_info, reused between calls.
+        self._rtt_channel_name = (_u8 * 32)()
+
+        # Output buffers reused by rtt_read. The data buffer only grows, to the largest length requested so far.
+        self._rtt_read_buffer = (_u8 * 0)()
+        self._rtt_data_read = _u32()
+
         _logger = logging.getLogger(__name__)
         self._logger = Parameters.LoggerAdapter(_logger, "Probes." + str(logger_id), log=log)
 
@@ -225,10 +356,8 @@ class Probe(object):
         self.close()
 
     def close(self):
-        if self._handle is not None and self._api.is_open():
-            result = self._api.lib.NRFJPROG_probe_uninit(ctypes.byref(self._handle))
-            if result != NrfjprogdllErr.SUCCESS:
-                raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        if self._handle is not None and self._api._is_open:
+            self._check(self._api.lib.NRFJPROG_probe_uninit(_byref(self._handle)))
             self._handle = None
         self._api.deregister_probe(self)
 
@@ -244,23 +373,28 @@ class Probe(object):
         """
         return self._logger.get_errors()
 
+    def _check(self, result):
+        """
+        Raises an APIError carrying the logged DLL errors if result is not NrfjprogdllErr.SUCCESS.
+
+        @param int result: Return value of a highlevelnrfjprog DLL function.
+        """
+        if result != _SUCCESS:
+            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+
     def probe_reset(self):
         """
         Resets the connected debug probe.
         """
 
-        result = self._api.lib.NRFJPROG_probe_reset(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_probe_reset(self._handle))
 
     def probe_replace_fw(self):
         """
         Replace the firmware of the connected debug probe.
         """
 
-        result = self._api.lib.NRFJPROG_probe_replace_fw(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_probe_replace_fw(self._handle))
 
     def setup_qspi(self, memory_size=None, qspi_ini_params=QSPIInitParams()):
         """
@@ -274,11 +408,7 @@ class Probe(object):
         if not is_u32(memory_size):
             raise TypeError('The memory_size parameter must fit an unsigned 32-bit value.')
 
-        memory_size = ctypes.c_uint32(memory_size)
-
-        result = self._api.lib.NRFJPROG_probe_setup_qspi(self._handle, memory_size, qspi_ini_params)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_probe_setup_qspi(self._handle, memory_size, qspi_ini_params))
 
     def setup_qspi_with_ini(self, ini_path=QSPIIniFile):
         """
@@ -287,53 +417,42 @@ class Probe(object):
         @param Path ini_path: Path to ini file containing qspi setup.
         """
 
-        ini_path = str(ini_path).encode('utf-8')
-        result = self._api.lib.NRFJPROG_probe_setup_qspi_ini(self._handle, ini_path)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        ini_path = encode_path(ini_path)
+        self._check(self._api.lib.NRFJPROG_probe_setup_qspi_ini(self._handle, ini_path))
 
     def set_coprocessor(self, coprocessor):
         """
         Sets coprocessor to use for subsequent operations.
         @param CoProcessor coprocessor: Target coprocessor.
         """
-        if not is_enum(coprocessor, CoProcessor):
+        coprocessor = decode_enum(coprocessor, CoProcessor)
+        if coprocessor is None:
             raise TypeError('Parameter coprocessor must be of type int, str or CoProcessor enumeration.')
 
-        coprocessor = ctypes.c_int(decode_enum(coprocessor, CoProcessor))
-
-        result = self._api.lib.NRFJPROG_probe_set_coprocessor(self._handle, coprocessor)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_probe_set_coprocessor(self._handle, coprocessor))
 
     def get_library_info(self):
         library_info = LibraryInfoStruct(0)
-        result = self._api.lib.NRFJPROG_get_library_info(self._handle, ctypes.byref(library_info))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_get_library_info(self._handle, _byref(library_info)))
 
         return LibraryInfo(library_info)
 
     def get_probe_info(self):
         probe_info = ProbeInfoStruct(0)
-        result = self._api.lib.NRFJPROG_get_probe_info(self._handle, ctypes.byref(probe_info))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_get_probe_info(self._handle, _byref(probe_info)))
 
         return ProbeInfo(probe_info)
 
     def get_device_info(self):
         device_info = DeviceInfoStruct(0)
-        result = self._api.lib.NRFJPROG_get_device_info(self._handle, ctypes.byref(device_info))
-        if result != NrfjprogdllErr.SUCCESS:
+        result = self._api.lib.NRFJPROG_get_device_info(self._handle, _byref(device_info))
+        if result != _SUCCESS:
             self._logger.warning("get_device_info returned returned with error {}. DeviceInfo struct will have missing information.".format(result))
         return DeviceInfo(device_info, result)
 
     def get_readback_protection(self):
-        protection_status = ctypes.c_int(0)
-        result = self._api.lib.NRFJPROG_get_readback_protection(self._handle, ctypes.byref(protection_status))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        protection_status = self._enum_out
+        self._check(self._api.lib.NRFJPROG_get_readback_protection(self._handle, _byref(protection_status)))
 
         return ReadbackProtection(protection_status.value)
 
@@ -341,26 +460,18 @@ class Probe(object):
         if not isinstance(protection_status, ReadbackProtection):
             raise TypeError('Parameter protection_status must be of type int, str or ReadbackProtection enumeration.')
 
-        protection_status = ctypes.c_int(decode_enum(protection_status, ReadbackProtection))
-
-        result = self._api.lib.NRFJPROG_readback_protect(self._handle, protection_status)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_readback_protect(self._handle, protection_status))
 
     def get_erase_protection(self):
-        is_erase_protect = ctypes.c_bool()
-        result = self._api.lib.NRFJPROG_is_eraseprotect_enabled(self._handle, ctypes.byref(is_erase_protect))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        is_erase_protect = self._bool_out
+        self._check(self._api.lib.NRFJPROG_is_eraseprotect_enabled(self._handle, _byref(is_erase_protect)))
         return is_erase_protect.value
 
     def enable_erase_protect(self):
-        result = self._api.lib.NRFJPROG_enable_eraseprotect(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_enable_eraseprotect(self._handle))
 
     def program(self, hex_path, program_options=None):
-        hex_path = str(hex_path).encode('utf-8')
+        hex_path = encode_path(hex_path)
 
         if program_options is None:
             result = self._api.lib.NRFJPROG_program(self._handle, hex_path, self._program_options)
@@ -369,11 +480,10 @@ class Probe(object):
                 raise TypeError('The program_options parameter must be an instance of class ProgramOptions.')
 
             result = self._api.lib.NRFJPROG_program(self._handle, hex_path, program_options)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(result)
 
     def read_to_file(self, hex_path, read_options=None):
-        hex_path = str(hex_path).encode('utf-8')
+        hex_path = encode_path(hex_path)
 
         if read_options is None:
             result = self._api.lib.NRFJPROG_read_to_file(self._handle, hex_path, self._read_options)
@@ -382,20 +492,15 @@ class Probe(object):
                 raise TypeError('The program_options parameter must be an instance of class ProgramOptions.')
 
             result = self._api.lib.NRFJPROG_read_to_file(self._handle, hex_path, read_options)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(result)
 
     def verify(self, hex_path, verify_action=VerifyAction.VERIFY_READ):
         if not isinstance(verify_action, VerifyAction):
             raise TypeError('Parameter verify_action must be of type int, str or VerifyAction enumeration.')
 
-        verify_action = ctypes.c_int(decode_enum(verify_action, VerifyAction))
+        hex_path = encode_path(hex_path)
 
-        hex_path = str(hex_path).encode('utf-8')
-
-        result = self._api.lib.NRFJPROG_verify(self._handle, hex_path, verify_action)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_verify(self._handle, hex_path, verify_action))
 
     def erase(self, erase_action=EraseAction.ERASE_ALL, start_address=0, end_address=0):
         if not isinstance(erase_action, EraseAction):
@@ -405,18 +510,10 @@ class Probe(object):
         if not is_u32(end_address):
             raise TypeError('The end_address parameter must fit an unsigned 32-bit value.')
 
-        erase_action = ctypes.c_int(decode_enum(erase_action, EraseAction))
-        start_address = ctypes.c_uint32(start_address)
-        end_address = ctypes.c_uint32(end_address)
-
-        result = self._api.lib.NRFJPROG_erase(self._handle, erase_action, start_address, end_address)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_erase(self._handle, erase_action, start_address, end_address))
 
     def recover(self):
-        result = self._api.lib.NRFJPROG_recover(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_recover(self._handle))
 
     def read(self, address, data_len=4):
         if not is_u32(address):
@@ -425,62 +522,183 @@ class Probe(object):
         if not is_u32(data_len):
             raise TypeError('The data_len parameter must fit an unsigned 32-bit value.')
 
-        address = ctypes.c_uint32(address)
-        data_len = ctypes.c_uint32(data_len)
-
-        if data_len.value == 4:
-            data = ctypes.c_uint32(0)
+        if data_len == 4:
+            data = self._u32_out
 
-            result = self._api.lib.NRFJPROG_read_u32(self._handle, address, ctypes.byref(data))
-            if result != NrfjprogdllErr.SUCCESS:
-                raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+            self._check(self._read_u32(self._handle, address, _byref(data)))
 
             return data.value
 
         else:
-            data = (ctypes.c_uint8 * data_len.value)()
+            # The DLL writes straight into the returned bytearray.
+            data = bytearray(data_len)
+
+            self._check(self._read(self._handle, address, (_u8 * data_len).from_buffer(data), data_len))
+
+            return data
 
-            result = self._api.lib.NRFJPROG_read(self._handle, address, ctypes.byref(data), data_len)
-            if result != NrfjprogdllErr.SUCCESS:
-                raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+    def read_into(self, address, buf):
+        """
+        Reads len(buf) bytes from the device starting at the given address directly into buf, without allocating an intermediate buffer.
 
-            return bytearray(data)
+        @param int address: Start address of the memory block to read.
+        @param buffer buf: Writable, C-contiguous buffer to read into, e.g. a bytearray, array.array or numpy array. Its whole size in bytes is read.
+        """
+        if not is_u32(address):
+            raise TypeError('The address parameter must fit an unsigned 32-bit value.')
+
+        data = to_uint8_view(buf)
+        if data is None:
+            raise TypeError('The buf parameter must be a writable, C-contiguous buffer of at most 0xFFFFFFFF bytes.')
+
+        data_len = len(data)
+
+        self._check(self._read(self._handle, address, data, data_len))
+
+    def read_many(self, ranges, max_gap=0):
+        """
+        Reads several memory ranges, merging overlapping and adjacent ones so that each merged span takes a single DLL call.
+
+        @param sequence ranges: (address, length) pairs to read. Ranges of length 0 read nothing and give an empty bytearray.
+        @param (optional) int max_gap: Ranges at most this many bytes apart are merged as well, reading the bytes in between. Only use a non-zero value for memory where any address can be read.
+        @return [bytearray]: Data read for each range, in the order of ranges.
+        """
+        ranges = list(ranges)
+        for address, length in ranges:
+            if not is_u32(address):
+                raise TypeError('The address of each range must fit an unsigned 32-bit value.')
+            if not is_u32(length) or address + length > 0x100000000:
+                raise TypeError('The length of each range must fit an unsigned 32-bit value and not extend past the end of the address space.')
+
+        if not is_u32(max_gap):
+            raise TypeError('The max_gap parameter must fit an unsigned 32-bit value.')
+
+        results = [None] * len(ranges)
+        spans = []
+        for index in sorted(range(len(ranges)), key=lambda i: ranges[i][0]):
+            address, length = ranges[index]
+            if length == 0:
+                # Nothing to read, the DLL is not called for empty ranges.
+                results[index] = bytearray()
+                continue
+            if spans and address <= spans[-1][1] + max_gap:
+                spans[-1][1] = max(spans[-1][1], address + length)
+                spans[-1][2].append(index)
+            else:
+                spans.append([address, address + length, [index]])
+
+        for start, end, indices in spans:
+            data = bytearray(end - start)
+            self._check(self._read(self._handle, start, (_u8 * len(data)).from_buffer(data), len(data)))
+
+            for index in indices:
+                offset = ranges[index][0] - start
+                results[index] = data[offset:offset + ranges[index][1]]
+
+        return results
 
     def write(self, address, data):
 
         if not is_u32(address):
             raise ValueError('The address parameter must be an unsigned 32-bit value.')
 
-        address = ctypes.c_uint32(address)
-
         if is_u32(data):
-            data = ctypes.c_uint32(data)
+            self._check(self._write_u32(self._handle, address, data))
+            return
 
-            result = self._api.lib.NRFJPROG_write_u32(self._handle, address, data)
+        data = to_uint8_array(data)
+        if data is None:
+            raise ValueError('The data parameter must be a uint32-representable value, or a sequence of uint8-representable values with at least one item.')
 
-            if result != NrfjprogdllErr.SUCCESS:
-                raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
-        elif is_valid_buf(data):
+        data_len = len(data)
 
-            data_len = ctypes.c_uint32(len(data))
-            data = (ctypes.c_uint8 * data_len.value)(*data)
+        self._check(self._write(self._handle, address, data, data_len))
 
-            result = self._api.lib.NRFJPROG_write(self._handle, address, ctypes.byref(data), data_len)
+    def write_many(self, pairs):
+        """
+        Writes several buffers, merging overlapping and adjacent ones so that each merged span takes a single DLL call.
+        Where buffers overlap, the one given last is written, as if write() had been called for each pair in order.
+        Ranges with gaps between them are not merged, as filling the gap would overwrite memory not passed in pairs.
 
-            if result != NrfjprogdllErr.SUCCESS:
-                raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
-        else:
-            raise ValueError('The data parameter must be a uint32-representable value, or a sequence of uint8-representable values with at least one item.')
+        @param sequence pairs: (address, data) pairs to write. data is any sequence of uint8-representable values with at least one item, as in write().
+        """
+        chunks = []
+        for address, data in pairs:
+            if not is_u32(address):
+                raise ValueError('The address of each pair must be an unsigned 32-bit value.')
+            data = to_uint8_array(data)
+            if data is None:
+                raise ValueError('The data of each pair must be a sequence of uint8-representable values with at least one item.')
+            if address + len(data) > 0x100000000:
+                raise ValueError('The data of each pair must not extend past the end of the address space.')
+            chunks.append((address, data))
+
+        spans = []
+        for index in sorted(range(len(chunks)), key=lambda i: chunks[i][0]):
+            address, data = chunks[index]
+            if spans and address <= spans[-1][1]:
+                spans[-1][1] = max(spans[-1][1], address + len(data))
+                spans[-1][2].append(index)
+            else:
+                spans.append([address, address + len(data), [index]])
+
+        for start, end, indices in spans:
+            payload = bytearray(end - start)
+            for index in sorted(indices):
+                address, data = chunks[index]
+                payload[address - start:address - start + len(data)] = data
+
+            self._check(self._write(self._handle, start, (_u8 * len(payload)).from_buffer(payload), len(payload)))
+
+    def read_many_u32(self, address, word_count):
+        """
+        Reads consecutive uint32_t values from the device starting at the given address, using a single DLL call.
+        Prefer this over calling read() in a loop.
+
+        @param int address: Start address of the memory block to read.
+        @param int word_count: Number of uint32_t values to read.
+        @return [int]: Values read.
+        """
+        if not is_u32(address):
+            raise TypeError('The address parameter must fit an unsigned 32-bit value.')
+
+        if not is_u32(word_count) or word_count == 0 or not is_u32(word_count * 4):
+            raise TypeError('The word_count parameter must be positive and fit an unsigned 32-bit value when multiplied by 4.')
+
+        words = new_uint32_array(word_count)
+        data_len = word_count * 4
+
+        self._check(self._read(self._handle, address, (_u8 * data_len).from_buffer(words), data_len))
+
+        if sys.byteorder != 'little':
+            words.byteswap()
+
+        return words.tolist()
+
+    def write_many_u32(self, address, values):
+        """
+        Writes consecutive uint32_t values into the device starting at the given address, using a single DLL call.
+        Prefer this over calling write() in a loop.
+
+        @param int address: Start address of the memory block to write.
+        @param sequence values: Values to write. Any iterable of unsigned 32-bit values, such as a list or an array.array, is valid as input.
+        """
+        if not is_u32(address):
+            raise ValueError('The address parameter must be an unsigned 32-bit value.')
+
+        words = to_uint32_array(values)
+        if words is None:
+            raise ValueError('The values parameter must be a sequence of unsigned 32-bit values with at least one item.')
+
+        data_len = len(words) * words.itemsize
+
+        self._check(self._write(self._handle, address, (_u8 * data_len).from_buffer(words), data_len))
 
     def reset(self, reset_action=ResetAction.RESET_SYSTEM):
         if not isinstance(reset_action, ResetAction):
             raise TypeError('Parameter reset_action must be of type int, str or ResetAction enumeration.')
 
-        reset_action = ctypes.c_int(decode_enum(reset_action, ResetAction))
-
-        result = self._api.lib.NRFJPROG_reset(self._handle, reset_action)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_reset(self._handle, reset_action))
 
     def run(self, pc, sp):
 
@@ -490,12 +708,7 @@ class Probe(object):
         if not is_u32(sp):
             raise ValueError('The sp parameter must be an unsigned 32-bit value.')
 
-        pc = ctypes.c_uint32(pc)
-        sp = ctypes.c_uint32(sp)
-
-        result = self._api.lib.NRFJPROG_run(self._handle, pc, sp)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_run(self._handle, pc, sp))
 
 
 class MCUBootDFUProbe(Probe):
@@ -525,13 +738,9 @@ class MCUBootDFUProbe(Probe):
 
         try:
             self._handle = ctypes.c_void_p(None)
-            serial_port = serial_port.encode('utf-8')
-            baud_rate = ctypes.c_uint32(baud_rate)
-            timeout = ctypes.c_uint32(timeout)
+            serial_port = encode_path(serial_port)
 
-            result = self._api.lib.NRFJPROG_mcuboot_dfu_init_ex(ctypes.byref(self._handle), None, self._logger.log_cb, None, serial_port, baud_rate, timeout)
-            if result != NrfjprogdllErr.SUCCESS:
-                raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+            self._check(self._api.lib.NRFJPROG_mcuboot_dfu_init_ex(_byref(self._handle), None, self._logger.log_cb, self._logger.log_param, serial_port, baud_rate, timeout))
         except (APIError, TypeError):
             self._handle = None
             raise
@@ -567,13 +776,9 @@ class ModemUARTDFUProbe(Probe):
             raise TypeError('The timeout parameter must fit an unsigned 32-bit value.')
         try:
             self._handle = ctypes.c_void_p(None)
-            serial_port = serial_port.encode('utf-8')
-            baud_rate = ctypes.c_uint32(baud_rate)
-            timeout = ctypes.c_uint32(timeout)
+            serial_port = encode_path(serial_port)
 
-            result = self._api.lib.NRFJPROG_modemdfu_dfu_serial_init_ex(ctypes.byref(self._handle), None, self._logger.log_cb, None, serial_port, baud_rate, timeout)
-            if result != NrfjprogdllErr.SUCCESS:
-                raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+            self._check(self._api.lib.NRFJPROG_modemdfu_dfu_serial_init_ex(_byref(self._handle), None, self._logger.log_cb, self._logger.log_param, serial_port, baud_rate, timeout))
         except (APIError, TypeError):
             self._handle = None
             raise
@@ -607,22 +812,20 @@ class IPCDFUProbe(Probe):
             clock_speed = 0
         if not is_u32(clock_speed):
             raise ValueError('The frequency parameter must be an unsigned 32-bit value.')
+        if not is_u32(snr):
+            raise ValueError('The snr parameter must be an unsigned 32-bit value.')
 
         try:
             self._handle = ctypes.c_void_p(None)
-            snr = ctypes.c_uint32(snr)
-            clock_speed = ctypes.c_uint32(clock_speed)
 
             if jlink_arm_dll_path is not None:
-                jlink_arm_dll_path = str(jlink_arm_dll_path).encode('utf-8')
+                jlink_arm_dll_path = encode_path(jlink_arm_dll_path)
 
-            if not is_enum(coprocessor, CoProcessor):
+            coprocessor = decode_enum(coprocessor, CoProcessor)
+            if coprocessor is None:
                 raise TypeError('Parameter coprocessor must be of type int, str or CoProcessor enumeration.')
-            coprocessor = ctypes.c_int(decode_enum(coprocessor, CoProcessor))
 
-            result = self._api.lib.NRFJPROG_dfu_init_ex(ctypes.byref(self._handle), None, self._logger.log_cb, None, snr, clock_speed, coprocessor, jlink_arm_dll_path)
-            if result != NrfjprogdllErr.SUCCESS:
-                raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+            self._check(self._api.lib.NRFJPROG_dfu_init_ex(_byref(self._handle), None, self._logger.log_cb, self._logger.log_param, snr, clock_speed, coprocessor, jlink_arm_dll_path))
         except (APIError, TypeError):
             self._handle = None
             raise
@@ -656,18 +859,16 @@ class DebugProbe(Probe):
             clock_speed = 0
         if not is_u32(clock_speed):
             raise ValueError('The frequency parameter must be an unsigned 32-bit value.')
+        if not is_u32(snr):
+            raise ValueError('The snr parameter must be an unsigned 32-bit value.')
 
         try:
             self._handle = ctypes.c_void_p(None)
-            snr = ctypes.c_uint32(snr)
-            clock_speed = ctypes.c_uint32(clock_speed)
 
             if jlink_arm_dll_path is not None:
-                jlink_arm_dll_path = str(jlink_arm_dll_path).encode('utf-8')
+                jlink_arm_dll_path = encode_path(jlink_arm_dll_path)
 
-            result = self._api.lib.NRFJPROG_probe_init_ex(ctypes.byref(self._handle), None, self._logger.log_cb, None, snr, clock_speed, jlink_arm_dll_path)
-            if result != NrfjprogdllErr.SUCCESS:
-                raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+            self._check(self._api.lib.NRFJPROG_probe_init_ex(_byref(self._handle), None, self._logger.log_cb, self._logger.log_param, snr, clock_speed, jlink_arm_dll_path))
         except (APIError, TypeError):
             self._handle = None
             raise
@@ -685,11 +886,9 @@ class DebugProbe(Probe):
 
         @return bool: True if started.
         """
-        started = ctypes.c_bool()
+        started = self._bool_out
 
-        result = self._api.lib.NRFJPROG_is_rtt_started(self._handle, ctypes.byref(started))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_is_rtt_started(self._handle, _byref(started)))
 
         return started.value
 
@@ -702,20 +901,14 @@ class DebugProbe(Probe):
         if not is_u32(addr):
             raise ValueError('The address parameter must be an unsigned 32-bit value.')
 
-        addr = ctypes.c_uint32(addr)
-
-        result = self._api.lib.NRFJPROG_rtt_set_control_block_address(self._handle, addr)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_rtt_set_control_block_address(self._handle, addr))
 
     def rtt_start(self):
         """
         Starts RTT.
 
         """
-        result = self._api.lib.NRFJPROG_rtt_start(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_rtt_start(self._handle))
 
     def rtt_is_control_block_found(self):
         """
@@ -723,11 +916,9 @@ class DebugProbe(Probe):
 
         @return boolean: True if found.
         """
-        is_control_block_found = ctypes.c_bool()
+        is_control_block_found = self._bool_out
 
-        result = self._api.lib.NRFJPROG_rtt_is_control_block_found(self._handle, ctypes.byref(is_control_block_found))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_rtt_is_control_block_found(self._handle, _byref(is_control_block_found)))
 
         return is_control_block_found.value
 
@@ -736,9 +927,7 @@ class DebugProbe(Probe):
         Stops RTT.
 
         """
-        result = self._api.lib.NRFJPROG_rtt_stop(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_rtt_stop(self._handle))
 
     def rtt_read(self, channel_index, length, encoding='utf-8'):
         """
@@ -758,16 +947,14 @@ class DebugProbe(Probe):
         if encoding is not None and not is_valid_encoding(encoding):
             raise ValueError('The encoding parameter must be either None or a standard encoding in python.')
 
-        channel_index = ctypes.c_uint32(channel_index)
-        length = ctypes.c_uint32(length)
-        data = (ctypes.c_uint8 * length.value)()
-        data_read = ctypes.c_uint32()
+        if len(self._rtt_read_buffer) < length:
+            self._rtt_read_buffer = (_u8 * length)()
+        data = self._rtt_read_buffer
+        data_read = self._rtt_data_read
 
-        result = self._api.lib.NRFJPROG_rtt_read(self._handle, channel_index, ctypes.byref(data), length, ctypes.byref(data_read))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._rtt_read(self._handle, channel_index, data, length, _byref(data_read)))
 
-        return bytearray(data[0:data_read.value]) if encoding is None else bytearray(data[0:data_read.value]).decode(encoding).encode('utf-8') if sys.version_info[0] == 2 else bytearray(data[0:data_read.value]).decode(encoding)
+        return decode_rtt_data(data, data_read.value, encoding)
 
     def rtt_write(self, channel_index, msg, encoding='utf-8'):
         """
@@ -784,18 +971,13 @@ class DebugProbe(Probe):
         if encoding is not None and not is_valid_encoding(encoding):
             raise ValueError('The encoding parameter must be either None or a standard encoding in python.')
 
-        msg = bytearray(msg.encode(encoding)) if encoding else bytearray(msg)
-        if not is_valid_buf(msg):
+        data = encode_rtt_message(msg, encoding)
+        if data is None:
             raise ValueError('The msg parameter must be a sequence type with at least one item.')
 
-        channel_index = ctypes.c_uint32(channel_index)
-        length = ctypes.c_uint32(len(msg))
-        data = (ctypes.c_uint8 * length.value)(*msg)
-        data_written = ctypes.c_uint32()
+        data_written = self._u32_out
 
-        result = self._api.lib.NRFJPROG_rtt_write(self._handle, channel_index, ctypes.byref(data), length, ctypes.byref(data_written))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._rtt_write(self._handle, channel_index, data, len(data), _byref(data_written)))
 
         return data_written.value
 
@@ -805,12 +987,10 @@ class DebugProbe(Probe):
 
         @return (int, int): Tuple containing the number of down RTT channels and the number of up RTT channels.
         """
-        down_channel_number = ctypes.c_uint32()
-        up_channel_number = ctypes.c_uint32()
+        down_channel_number = self._rtt_down_channel_count
+        up_channel_number = self._rtt_up_channel_count
 
-        result = self._api.lib.NRFJPROG_rtt_read_channel_count(self._handle, ctypes.byref(down_channel_number), ctypes.byref(up_channel_number))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_rtt_read_channel_count(self._handle, _byref(down_channel_number), _byref(up_channel_number)))
 
         return down_channel_number.value, up_channel_number.value
 
@@ -825,21 +1005,43 @@ class DebugProbe(Probe):
         if not is_u32(channel_index):
             raise ValueError('The channel_index parameter must be an unsigned 32-bit value.')
 
-        if not is_enum(direction, RTTChannelDirection):
-            raise ValueError('Parameter direction must be of type int, str or RTTChannelDirection enumeration.')
-
         direction = decode_enum(direction, RTTChannelDirection)
         if direction is None:
             raise ValueError('Parameter direction must be of type int, str or RTTChannelDirection enumeration.')
 
-        channel_index = ctypes.c_uint32(channel_index)
-        direction = ctypes.c_int(direction.value)
-        name_len = ctypes.c_uint32(32)
-        name = (ctypes.c_uint8 * 32)()
-        size = ctypes.c_uint32()
+        name = self._rtt_channel_name
+        name_len = len(name)
+        size = self._u32_out
 
-        result = self._api.lib.NRFJPROG_rtt_read_channel_info(self._handle, channel_index, direction, ctypes.byref(name), name_len, ctypes.byref(size))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors(), log=self._logger.error)
+        self._check(self._api.lib.NRFJPROG_rtt_read_channel_info(self._handle, channel_index, direction, name, name_len, _byref(size)))
+
+        return self._decode_channel_name(name), size.value
 
-        return ''.join(chr(i) for i in name if i != 0), size.value
+    def rtt_enumerate_channels(self):
+        """
+        Reads the info from all RTT channels, down channels first.
+
+        @return [(RTTChannelDirection, int, str, int)]: List of tuples containing the direction, index, name and size of channel buffer of each RTT channel.
+        """
+        down_channel_number, up_channel_number = self.rtt_read_channel_count()
+
+        read_channel_info = self._api.lib.NRFJPROG_rtt_read_channel_info
+        handle = self._handle
+        name = self._rtt_channel_name
+        name_len = len(name)
+        size = self._u32_out
+        size_p = _byref(size)
+
+        channels = []
+        for direction, channel_number in ((RTTChannelDirection.DOWN_DIRECTION, down_channel_number),
+                                          (RTTChannelDirection.UP_DIRECTION, up_channel_number)):
+            for channel_index in range(channel_number):
+                self._check(read_channel_info(handle, channel_index, direction, name, name_len, size_p))
+                channels.append((direction, channel_index, self._decode_channel_name(name), size.value))
+
+        return channels
+
+    @staticmethod
+    def _decode_channel_name(name):
+        """ Decodes the NUL terminated channel name written by NRFJPROG_rtt_read_channel_info. """
+        return bytes(name).split(b'\x00', 1)[0].decode('latin-1')
@@ -6,58 +6,152 @@ It is no longer used in LowLevel.API or MultiAPI.API, but maintained and tested
 These functions expect a standard OS installation and a default installation path for the SEGGER shared library. If these 
 conditions are not met the absolute path of the SEGGER JLinkARM shared library must be provided when instantiating an
 API or MultiAPI object.
+
+find_latest_dll scans the SEGGER installation once per process and caches the result. Call find_latest_dll.cache_clear()
+to pick up a J-Link software installed or removed since the first call.
 """
 
-import fnmatch
+import functools
 import os
 import sys
 
 
-if sys.platform.lower().startswith('win'):
+_IS_WINDOWS = sys.platform.startswith('win')
+_IS_LINUX = sys.platform.startswith('linux')
+_IS_MACOS = sys.platform.startswith('darwin')
+
+if _IS_WINDOWS:
     _DEFAULT_SEGGER_ROOT_PATH = []
     if 'PROGRAMFILES(X86)' in os.environ:
         _DEFAULT_SEGGER_ROOT_PATH.append(os.path.join(os.environ['PROGRAMFILES(X86)'], 'SEGGER'))
     if 'PROGRAMFILES' in os.environ:
         _DEFAULT_SEGGER_ROOT_PATH.append(os.path.join(os.environ['PROGRAMFILES'], 'SEGGER'))
-elif sys.platform.lower().startswith('linux'):
+    _JLINK_FILE_NAME = 'JLink_x64.dll' if sys.maxsize > 2 ** 32 else 'JLinkARM.dll'
+elif _IS_LINUX:
     _DEFAULT_SEGGER_ROOT_PATH = r'/opt/SEGGER/JLink'
-elif sys.platform.lower().startswith('dar'):
+elif _IS_MACOS:
     _DEFAULT_SEGGER_ROOT_PATH = r'/Applications/SEGGER/JLink'
 
+# Sorts above every version. The unversioned JLink folder holds the newest installation, and the unversioned
+# libjlinkarm library is the symlink SEGGER points at the newest one.
+_UNVERSIONED_JLINK_DIR = (float('inf'),)
+
+
+def _parse_jlink_version(name):
+    """
+    Parses a folder name JLink_V<major><minor><patch letter> into a version tuple. The minor version is always the
+    last two digits. Names that do not match sort below all versions.
+
+    >>> _parse_jlink_version('JLink_V794e')
+    (7, 94, 'e')
+    >>> _parse_jlink_version('JLink_V1002')
+    (10, 2, '')
+    >>> _parse_jlink_version('JLink_V1002') > _parse_jlink_version('JLink_V794e')
+    True
+    >>> _parse_jlink_version('JLink_Vx')
+    ()
+    """
+    version = name[len('JLink_V'):]
+    patch = version[-1:] if version[-1:].isalpha() else ''
+    digits = version[:len(version) - len(patch)]
+    if not name.startswith('JLink_V') or len(digits) < 3 or not digits.isdecimal():
+        return ()
+    return int(digits[:-2]), int(digits[-2:]), patch
+
+
+def _parse_library_version(name):
+    """
+    Parses a file name like libjlinkarm.so.7.94.2 or libjlinkarm.7.94.2.dylib into (7, 94, 2). Unversioned names sort
+    above every version, so that the libjlinkarm.so or libjlinkarm.dylib symlink is preferred when it exists.
+
+    >>> _parse_library_version('libjlinkarm.so.7.94.2')
+    (7, 94, 2)
+    >>> _parse_library_version('libjlinkarm.so') > _parse_library_version('libjlinkarm.so.10.2')
+    True
+    """
+    return tuple(int(part) for part in name.split('.') if part.isdecimal()) or _UNVERSIONED_JLINK_DIR
+
+
+def _list_dir(path):
+    """ Lists the entries of path, or returns None if it is not a readable folder. Replaces a separate isdir() check. """
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return None
 
+
+# Folders of a J-Link software installation that hold no libraries, skipped when searching for the DLL.
+_JLINK_SKIPPED_DIRS = frozenset(('doc', 'docs', 'samples', 'etm', 'firmwares'))
+
+
+def _find_file(top, file_name):
+    """ Depth-first search of top for file_name, stopping at the first match like the os.walk loop it replaces. """
+    entries = _list_dir(top)
+    if entries is None:
+        return None
+
+    # The file types come from the listing itself, is_file() and is_dir() need no further stat on Windows and Linux.
+    for entry in entries:
+        if entry.name == file_name and entry.is_file():
+            return entry.path
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False) and entry.name.lower() not in _JLINK_SKIPPED_DIRS:
+            found = _find_file(entry.path, file_name)
+            if found is not None:
+                return found
+
+    return None
+
+
+# The SEGGER installation is not expected to change while the process runs, scan it once.
+@functools.lru_cache(maxsize=1)
 def find_latest_dll():
 
-    if sys.platform.lower().startswith('win'):
+    if _IS_WINDOWS:
         # Newest Segger J-Link software is now installed in the folder "JLink"
         # If the "JLink" folder does not exist, look for the "highest" folder that matches JLink_V*
         jlink_sw_dirs = list()
 
         for default_path in _DEFAULT_SEGGER_ROOT_PATH:
-            if not os.path.isdir(default_path):
+            entries = _list_dir(default_path)
+            if entries is None:
                 return None
-            if os.path.exists(os.path.join(default_path, 'JLink')):
-                jlink_sw_dirs.append(os.path.join(default_path, 'JLink'))
+            jlink_dirs = [entry.path for entry in entries if entry.name == 'JLink']
+            if jlink_dirs:
+                jlink_sw_dirs.append((_UNVERSIONED_JLINK_DIR, jlink_dirs[0]))
             else:
-                jlink_sw_dirs.extend([f for f in os.listdir(default_path) if fnmatch.fnmatch(f, 'JLink_V*')])
+                jlink_sw_dirs.extend((_parse_jlink_version(entry.name), entry.path) for entry in entries
+                                     if entry.name.startswith('JLink_V'))
+
+        if not jlink_sw_dirs:
+            return None
+        jlink_sw_dir = max(jlink_sw_dirs)[1]
 
-        jlink_sw_dir = sorted(jlink_sw_dirs)[-1]
+        # The DLL is installed in the root or the bin_x64 folder of the installation, look there before walking the tree.
+        for jlink_file_dir in (jlink_sw_dir, os.path.join(jlink_sw_dir, 'bin_x64')):
+            jlink_file_path = os.path.join(jlink_file_dir, _JLINK_FILE_NAME)
+            if os.path.isfile(jlink_file_path):
+                return jlink_file_path
 
-        jlink_file_name = 'JLink_x64.dll' if sys.maxsize > 2 ** 32 else 'JLinkARM.dll'
         # Walk through latest Segger JLinkARM installation folder in search of the appropriate DLL.
-        for root, dirs, files in os.walk(jlink_sw_dir):
-            if jlink_file_name in files:
-                return os.path.join(root, jlink_file_name)
+        return _find_file(jlink_sw_dir, _JLINK_FILE_NAME)
 
-    elif sys.platform.lower().startswith('linux'):
-        if not os.path.isdir(_DEFAULT_SEGGER_ROOT_PATH):
+    elif _IS_LINUX:
+        entries = _list_dir(_DEFAULT_SEGGER_ROOT_PATH)
+        if entries is None:
             return None
-        # Adding .dummy to filenames in linux (.so.x.x.x.dummy) because python compare strings will then work properly with the version number compare.
-        jlink_so_files = sorted([f + ".dummy" for f in os.listdir(_DEFAULT_SEGGER_ROOT_PATH) if fnmatch.fnmatch(f, 'libjlinkarm.so*')])
-        return os.path.join(_DEFAULT_SEGGER_ROOT_PATH, jlink_so_files[-1][:-len(".dummy")])
+        latest = max((entry.name for entry in entries if entry.name.startswith('libjlinkarm.so')),
+                     key=_parse_library_version, default=None)
+        return os.path.join(_DEFAULT_SEGGER_ROOT_PATH, latest) if latest is not None else None
 
-    elif sys.platform.lower().startswith('dar'):
-        if not os.path.isdir(_DEFAULT_SEGGER_ROOT_PATH):
+    elif _IS_MACOS:
+        entries = _list_dir(_DEFAULT_SEGGER_ROOT_PATH)
+        if entries is None:
             return None
-        jlink_dylib_files = sorted([f for f in os.listdir(_DEFAULT_SEGGER_ROOT_PATH) if fnmatch.fnmatch(f, 'libjlinkarm.*dylib')])
-        return os.path.join(_DEFAULT_SEGGER_ROOT_PATH, jlink_dylib_files[-1])
+        latest = max((entry.name for entry in entries
+                      if entry.name.startswith('libjlinkarm.') and entry.name.endswith('dylib')),
+                     key=_parse_library_version, default=None)
+        return os.path.join(_DEFAULT_SEGGER_ROOT_PATH, latest) if latest is not None else None
     
\ No newline at end of file
@@ -14,6 +14,7 @@ import ctypes
 import enum
 import os
 import sys
+import types
 import datetime
 import logging
 from pathlib import Path
@@ -38,11 +39,230 @@ Deprecated: Do not use, use log parameter in API constructor instead.
 DEBUG_OUTPUT = False
 QSPIIniFile = Path(__file__).parent / "QspiDefault.ini"
 
+
+"""
+Location of the nrfjprog DLL shipped with the package, resolved once at import time.
+"""
+if sys.maxsize > 2 ** 32:
+    _NRFJPROG_DLL_FOLDER = 'lib_x64'
+else:
+    _NRFJPROG_DLL_FOLDER = 'lib_x86'
+
+_os_name = sys.platform.lower()
+
+if _os_name.startswith('win'):
+    _NRFJPROG_DLL_NAME = 'nrfjprog.dll'
+elif _os_name.startswith('linux'):
+    _NRFJPROG_DLL_NAME = 'libnrfjprogdll.so'
+elif _os_name.startswith('dar'):
+    _NRFJPROG_DLL_NAME = 'libnrfjprogdll.dylib'
+else:
+    _NRFJPROG_DLL_NAME = None  # Unsupported OS, reported when API is instantiated.
+
+_NRFJPROG_DLL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), _NRFJPROG_DLL_FOLDER,
+                                  _NRFJPROG_DLL_NAME or '')
+_NRFJPROG_DLL_PATH_EXISTS = _NRFJPROG_DLL_NAME is not None and os.path.exists(_NRFJPROG_DLL_PATH)
+
+
+"""
+Function prototypes of the nrfjprog DLL, see nrfjprogdll.h. All functions return nrfjprogdll_err_t.
+Declaring them up front lets ctypes convert the arguments without guessing their types on every call.
+"""
+_handle = ctypes.c_void_p
+_handle_p = ctypes.POINTER(ctypes.c_void_p)
+_u8 = ctypes.c_uint8
+_u8_p = ctypes.POINTER(ctypes.c_uint8)
+_u32 = ctypes.c_uint32
+_u32_p = ctypes.POINTER(ctypes.c_uint32)
+_bool = ctypes.c_bool
+_bool_p = ctypes.POINTER(ctypes.c_bool)
+_enum = ctypes.c_int
+_enum_p = ctypes.POINTER(ctypes.c_int)
+_str = ctypes.c_char_p
+_log_cb = ctypes.c_void_p  # msg_callback_ex *, a CFUNCTYPE instance or None.
+_byref = ctypes.byref
+
+_NRFJPROG_PROTOTYPES = {
+    'NRFJPROG_dll_version_inst':                    [_handle, _u32_p, _u32_p, _u8_p],
+    'NRFJPROG_is_dll_open_inst':                    [_handle, _bool_p],
+    'NRFJPROG_open_dll_inst':                       [_handle_p, _str, _log_cb, ctypes.c_void_p, _enum],
+    'NRFJPROG_close_dll_inst':                      [_handle_p],
+    'NRFJPROG_enum_emu_com_inst':                   [_handle, _u32, ctypes.POINTER(ComPortInfoStruct), _u32, _u32_p],
+    'NRFJPROG_enum_emu_snr_inst':                   [_handle, _u32_p, _u32, _u32_p],
+    'NRFJPROG_is_connected_to_emu_inst':            [_handle, _bool_p],
+    'NRFJPROG_connect_to_emu_with_snr_inst':        [_handle, _u32, _u32],
+    'NRFJPROG_connect_to_emu_without_snr_inst':     [_handle, _u32],
+    'NRFJPROG_reset_connected_emu_inst':            [_handle],
+    'NRFJPROG_replace_connected_emu_fw_inst':       [_handle],
+    'NRFJPROG_read_connected_emu_snr_inst':         [_handle, _u32_p],
+    'NRFJPROG_read_connected_emu_fwstr_inst':       [_handle, _str, _u32],
+    'NRFJPROG_disconnect_from_emu_inst':            [_handle],
+    'NRFJPROG_select_family_inst':                  [_handle, _enum],
+    'NRFJPROG_is_coprocessor_enabled_inst':         [_handle, _enum, _bool_p],
+    'NRFJPROG_enable_coprocessor_inst':             [_handle, _enum],
+    'NRFJPROG_disable_coprocessor_inst':            [_handle, _enum],
+    'NRFJPROG_select_coprocessor_inst':             [_handle, _enum],
+    'NRFJPROG_recover_inst':                        [_handle],
+    'NRFJPROG_is_connected_to_device_inst':         [_handle, _bool_p],
+    'NRFJPROG_connect_to_device_inst':              [_handle],
+    'NRFJPROG_disconnect_from_device_inst':         [_handle],
+    'NRFJPROG_readback_protect_inst':               [_handle, _enum],
+    'NRFJPROG_readback_status_inst':                [_handle, _enum_p],
+    'NRFJPROG_enable_eraseprotect_inst':            [_handle],
+    'NRFJPROG_is_eraseprotect_enabled_inst':        [_handle, _bool_p],
+    'NRFJPROG_read_region_0_size_and_source_inst':  [_handle, _u32_p, _enum_p],
+    'NRFJPROG_debug_reset_inst':                    [_handle],
+    'NRFJPROG_sys_reset_inst':                      [_handle],
+    'NRFJPROG_pin_reset_inst':                      [_handle],
+    'NRFJPROG_is_bprot_enabled_inst':               [_handle, _bool_p, _u32, _u32],
+    'NRFJPROG_disable_bprot_inst':                  [_handle],
+    'NRFJPROG_erase_all_inst':                      [_handle],
+    'NRFJPROG_erase_page_inst':                     [_handle, _u32],
+    'NRFJPROG_erase_uicr_inst':                     [_handle],
+    'NRFJPROG_write_u32_inst':                      [_handle, _u32, _u32, _bool],
+    'NRFJPROG_read_u32_inst':                       [_handle, _u32, _u32_p],
+    'NRFJPROG_write_inst':                          [_handle, _u32, _u8_p, _u32, _bool],
+    'NRFJPROG_read_inst':                           [_handle, _u32, _u8_p, _u32],
+    'NRFJPROG_is_halted_inst':                      [_handle, _bool_p],
+    'NRFJPROG_halt_inst':                           [_handle],
+    'NRFJPROG_run_inst':                            [_handle, _u32, _u32],
+    'NRFJPROG_go_inst':                             [_handle],
+    'NRFJPROG_step_inst':                           [_handle],
+    'NRFJPROG_read_ram_sections_count_inst':        [_handle, _u32_p],
+    'NRFJPROG_read_ram_sections_size_inst':         [_handle, _u32_p, _u32],
+    'NRFJPROG_read_ram_sections_power_status_inst': [_handle, _enum_p, _u32],
+    'NRFJPROG_power_ram_all_inst':                  [_handle],
+    'NRFJPROG_unpower_ram_section_inst':            [_handle, _u32],
+    'NRFJPROG_read_memory_descriptors_inst':        [_handle, ctypes.POINTER(MemoryDescriptionStruct), _u32, _u32_p],
+    'NRFJPROG_read_page_sizes_inst':                [_handle, ctypes.POINTER(MemoryDescriptionStruct), ctypes.POINTER(PageRepetitionsStruct), _u32, _u32_p],
+    'NRFJPROG_read_cpu_register_inst':              [_handle, _enum, _u32_p],
+    'NRFJPROG_write_cpu_register_inst':             [_handle, _enum, _u32],
+    'NRFJPROG_read_device_version_inst':            [_handle, _enum_p],
+    'NRFJPROG_read_device_info_inst':               [_handle, _enum_p, _enum_p, _enum_p, _enum_p],
+    'NRFJPROG_read_device_family_inst':             [_handle, _enum_p],
+    'NRFJPROG_read_debug_port_register_inst':       [_handle, _u8, _u32_p],
+    'NRFJPROG_write_debug_port_register_inst':      [_handle, _u8, _u32],
+    'NRFJPROG_read_access_port_register_inst':      [_handle, _u8, _u8, _u32_p],
+    'NRFJPROG_write_access_port_register_inst':     [_handle, _u8, _u8, _u32],
+    'NRFJPROG_is_rtt_started_inst':                 [_handle, _bool_p],
+    'NRFJPROG_rtt_set_control_block_address_inst':  [_handle, _u32],
+    'NRFJPROG_rtt_start_inst':                      [_handle],
+    'NRFJPROG_rtt_is_control_block_found_inst':     [_handle, _bool_p],
+    'NRFJPROG_rtt_stop_inst':                       [_handle],
+    'NRFJPROG_rtt_read_inst':                       [_handle, _u32, _u8_p, _u32, _u32_p],
+    'NRFJPROG_rtt_write_inst':                      [_handle, _u32, _str, _u32, _u32_p],
+    'NRFJPROG_rtt_read_channel_count_inst':         [_handle, _u32_p, _u32_p],
+    'NRFJPROG_rtt_read_channel_info_inst':          [_handle, _u32, _enum, _u8_p, _u32, _u32_p],
+    'NRFJPROG_is_qspi_init_inst':                   [_handle, _bool_p],
+    'NRFJPROG_qspi_init_inst':                      [_handle, _bool, ctypes.POINTER(QSPIInitParams)],
+    'NRFJPROG_qspi_init_ini_inst':                  [_handle, _str],
+    'NRFJPROG_qspi_start_inst':                     [_handle],
+    'NRFJPROG_qspi_configure_inst':                 [_handle, _bool, ctypes.POINTER(QSPIInitParams)],
+    'NRFJPROG_qspi_configure_ini_inst':             [_handle, _str],
+    'NRFJPROG_qspi_uninit_inst':                    [_handle],
+    'NRFJPROG_qspi_set_rx_delay_inst':              [_handle, _u8],
+    'NRFJPROG_qspi_set_size_inst':                  [_handle, _u32],
+    'NRFJPROG_qspi_get_size_inst':                  [_handle, _u32_p],
+    'NRFJPROG_qspi_read_inst':                      [_handle, _u32, _u8_p, _u32],
+    'NRFJPROG_qspi_write_inst':                     [_handle, _u32, _u8_p, _u32],
+    'NRFJPROG_qspi_erase_inst':                     [_handle, _u32, _enum],
+    'NRFJPROG_qspi_custom_inst':                    [_handle, _u8, _u32, _u8_p, _u8_p],
+    'NRFJPROG_program_file_inst':                   [_handle, _str],
+    'NRFJPROG_read_to_file_inst':                   [_handle, _str, ReadOptions],
+    'NRFJPROG_verify_file_inst':                    [_handle, _str, _enum],
+    'NRFJPROG_erase_file_inst':                     [_handle, _str, _enum, _enum],
+    # if colored(INTERNAL)
+    'NRFJPROG_masserase_inst':                      [_handle],
+    'NRFJPROG_ficrwrite_u32_inst':                  [_handle, _u32, _u32],
+    'NRFJPROG_ficrwrite_inst':                      [_handle, _u32, _u8_p, _u32],
+    # endif /* colored(INTERNAL) */
+}
+
+
+"""
+Functions whose trailing pointer arguments are pure output parameters, with the number of such parameters.
+"""
+_NRFJPROG_OUT_PARAM_FUNCTIONS = {
+    'NRFJPROG_dll_version_inst':                    3,
+    'NRFJPROG_is_dll_open_inst':                    1,
+    'NRFJPROG_is_connected_to_emu_inst':            1,
+    'NRFJPROG_read_connected_emu_snr_inst':         1,
+    'NRFJPROG_is_coprocessor_enabled_inst':         1,
+    'NRFJPROG_is_connected_to_device_inst':         1,
+    'NRFJPROG_readback_status_inst':                1,
+    'NRFJPROG_is_eraseprotect_enabled_inst':        1,
+    'NRFJPROG_read_region_0_size_and_source_inst':  2,
+    'NRFJPROG_read_u32_inst':                       1,
+    'NRFJPROG_is_halted_inst':                      1,
+    'NRFJPROG_read_ram_sections_count_inst':        1,
+    'NRFJPROG_read_cpu_register_inst':              1,
+    'NRFJPROG_read_device_version_inst':            1,
+    'NRFJPROG_read_device_family_inst':             1,
+    'NRFJPROG_read_debug_port_register_inst':       1,
+    'NRFJPROG_read_access_port_register_inst':      1,
+    'NRFJPROG_is_rtt_started_inst':                 1,
+    'NRFJPROG_rtt_is_control_block_found_inst':     1,
+    'NRFJPROG_rtt_read_channel_count_inst':         2,
+    'NRFJPROG_is_qspi_init_inst':                   1,
+    'NRFJPROG_qspi_get_size_inst':                  1,
+}
+
+
+# Function prototype and paramflags of every function in _NRFJPROG_OUT_PARAM_FUNCTIONS, see _bind_out_param_functions.
+_OUT_PARAM_PROTOTYPES = {
+    name: (ctypes.CFUNCTYPE(ctypes.c_int, *_NRFJPROG_PROTOTYPES[name]),
+           ((1,),) * (len(_NRFJPROG_PROTOTYPES[name]) - out_count) + ((2,),) * out_count)
+    for name, out_count in _NRFJPROG_OUT_PARAM_FUNCTIONS.items()
+}
+
+
+def _bind_out_param_functions(lib, api):
+    """
+    Binds the functions in _NRFJPROG_OUT_PARAM_FUNCTIONS for one API instance through prototypes with paramflags, so
+    that ctypes allocates the output parameters and returns their values. The result of every call is checked by
+    api._check. The instance is only referenced weakly, the bound functions are kept by the instance itself.
+    """
+    api_ref = weakref.ref(api)
+
+    def errcheck(result, function, arguments):
+        if result != _SUCCESS:
+            api_ref()._check(result)
+        return arguments
+
+    functions = {}
+    for name, (prototype, paramflags) in _OUT_PARAM_PROTOTYPES.items():
+        try:
+            function = prototype((name, lib), paramflags)
+        except AttributeError:
+            # Symbol not exported by this DLL, the getter is left unbound.
+            continue
+        function.errcheck = errcheck
+        functions[name] = function
+    return types.SimpleNamespace(**functions)
+
+
+_SUCCESS = int(NrfjprogdllErr.SUCCESS)
+
+# Name lookups for enum values returned by the DLL, avoids constructing enum members just to get their names.
+_READBACK_PROTECTION_NAMES = {member.value: member.name for member in ReadbackProtection}
+_REGION_0_SOURCE_NAMES = {member.value: member.name for member in Region0Source}
+_RAM_POWER_NAMES = {member.value: member.name for member in RamPower}
+_DEVICE_VERSION_NAMES = {member.value: member.name for member in DeviceVersion}
+_DEVICE_FAMILY_NAMES = {member.value: member.name for member in DeviceFamily}
+
+
+def _enum_name(names, enum_type, value):
+    """ Gets the name of an enum value returned by the DLL. Unknown values raise ValueError from the enum constructor. """
+    name = names.get(value)
+    return name if name is not None else enum_type(value).name
+
+
 class API(object):
     """
     Main class of the module. Instance the class to get access to nrfjprog.dll functions in Python.
 
     Note: A copy of nrfjprog.dll must be found in the working directory.
+    Note: An instance reuses internal buffers between calls and must not be used from several threads at once.
     """
 
     _DEFAULT_JLINK_SPEED_KHZ = 2000
@@ -64,6 +284,13 @@ class API(object):
         self._jlink_arm_dll_path = None
         self._handle = ctypes.c_void_p(None)
 
+        # Output buffers reused by enum_emu_snr, read_ram_sections_power_status, rtt_read and rtt_write.
+        self._serial_numbers = (_u32 * 127)()
+        self._ram_power_status = (_enum * 0)()
+        self._rtt_read_buffer = (_u8 * 0)()
+        self._rtt_data_read = _u32()
+        self._rtt_data_written = _u32()
+
         # Make a default "dead" finalizer. We'll initialize this in self.open.
         self._finalizer = weakref.finalize(self, lambda : None)
 
@@ -86,37 +313,22 @@ class API(object):
         self._logger = Parameters.LoggerAdapter(_logger, None, log=log, log_str_cb=log_str_cb, log_str=log_str, log_file_path=log_file_path,
                                          log_stringio=log_stringio)
 
-        this_dir = os.path.dirname(__file__)
-
-        if sys.maxsize > 2 ** 32:
-            nrfjprog_dll_folder = 'lib_x64'
-        else:
-            nrfjprog_dll_folder = 'lib_x86'
-
-        os_name = sys.platform.lower()
-
-        if os_name.startswith('win'):
-            nrfjprog_dll_name = 'nrfjprog.dll'
-        elif os_name.startswith('linux'):
-            nrfjprog_dll_name = 'libnrfjprogdll.so'
-        elif os_name.startswith('dar'):
-            nrfjprog_dll_name = 'libnrfjprogdll.dylib'
-        else:
+        if _NRFJPROG_DLL_NAME is None:
             raise ValueError("Unsupported OS")
 
-        nrfjprog_dll_path = os.path.join(os.path.abspath(this_dir), nrfjprog_dll_folder, nrfjprog_dll_name)
-
-        if os.path.exists(nrfjprog_dll_path):
+        if _NRFJPROG_DLL_PATH_EXISTS:
             try:
-                self._lib = ctypes.cdll.LoadLibrary(nrfjprog_dll_path)
+                self._lib = load_library(_NRFJPROG_DLL_PATH, _NRFJPROG_PROTOTYPES)
             except Exception as error:
                 raise RuntimeError("Could not load the NRFJPROG DLL: '{}'.".format(error))
         else:
             try:
-                self._lib = ctypes.cdll.LoadLibrary(nrfjprog_dll_name)
+                self._lib = load_library(_NRFJPROG_DLL_NAME, _NRFJPROG_PROTOTYPES)
             except Exception as error:
                 raise RuntimeError("Failed to load the NRFJPROG DLL by name: '{}.'".format(error))
 
+        self._getters = _bind_out_param_functions(self._lib, self)
+
     """
     nrfjprog.DLL functions.
 
@@ -128,14 +340,8 @@ class API(object):
 
         @return (int, int, str): Tuple containing the major, minor and revision of the dll.
         """
-        major = ctypes.c_uint32()
-        minor = ctypes.c_uint32()
-        revision = ctypes.c_uint8()
-
-        result = self._lib.NRFJPROG_dll_version_inst(self._handle,  ctypes.byref(major), ctypes.byref(minor), ctypes.byref(revision))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-        return major.value, minor.value, chr(revision.value)
+        major, minor, revision = self._getters.NRFJPROG_dll_version_inst(self._handle)
+        return major, minor, chr(revision)
 
     def is_open(self):
         """
@@ -143,12 +349,7 @@ class API(object):
 
         @return bool: True if open.
         """
-        opened = ctypes.c_bool()
-
-        result = self._lib.NRFJPROG_is_dll_open_inst(self._handle,  ctypes.byref(opened))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-        return opened.value
+        return self._getters.NRFJPROG_is_dll_open_inst(self._handle)
 
     def open(self):
         """
@@ -157,11 +358,9 @@ class API(object):
         """
         # No need to encode self._jlink_arm_dll_path since it is an ASCII string and that is what is expected by ctypes.
         # Function self._log_str_cb has already been encoded in __init__() function.
-        device_family = ctypes.c_int(self._device_family.value)
+        device_family = self._device_family
 
-        result = self._lib.NRFJPROG_open_dll_inst(ctypes.byref(self._handle), self._jlink_arm_dll_path, self._logger.log_cb, None, device_family)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_open_dll_inst(_byref(self._handle), self._jlink_arm_dll_path, self._logger.log_cb, self._logger.log_param, device_family))
 
         # Make sure that api is closed before api is destroyed
         self._finalizer = weakref.finalize(self, self.close)
@@ -171,7 +370,7 @@ class API(object):
         Closes and frees the JLinkARM DLL.
 
         """
-        self._lib.NRFJPROG_close_dll_inst(ctypes.byref(self._handle))
+        self._lib.NRFJPROG_close_dll_inst(_byref(self._handle))
 
         # Disable the api finalizer, as it's no longer necessary when the api is closed.
         self._finalizer.detach()
@@ -185,6 +384,15 @@ class API(object):
         """
         return self._logger.get_errors()
 
+    def _check(self, result):
+        """
+        Raises an APIError carrying the logged DLL errors if result is not NrfjprogdllErr.SUCCESS.
+
+        @param int result: Return value of an nrfjprog DLL function.
+        """
+        if result != _SUCCESS:
+            raise APIError(result, error_data=self.get_errors())
+
     def enum_emu_com_ports(self, serial_number):
         """
         Finds all comports currently associated with the serial number.
@@ -197,15 +405,12 @@ class API(object):
         if not is_u32(serial_number):
             raise ValueError('The serial_number parameter must be an unsigned 32-bit value.')
 
-        serial_number = ctypes.c_uint32(serial_number)
-        com_ports_len = ctypes.c_uint32(NRFJPROG_COM_PER_JLINK)
-        num_com_ports = ctypes.c_uint32()
+        com_ports_len = NRFJPROG_COM_PER_JLINK
+        num_com_ports = _u32()
         com_ports = (ComPortInfoStruct * NRFJPROG_COM_PER_JLINK)()
 
-        result = self._lib.NRFJPROG_enum_emu_com_inst(self._handle,  serial_number, ctypes.byref(com_ports), com_ports_len,
-                               ctypes.byref(num_com_ports))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_enum_emu_com_inst(self._handle,  serial_number, com_ports, com_ports_len,
+                               _byref(num_com_ports)))
 
         return [ComPortInfo(comport) for comport in com_ports[0:num_com_ports.value]]
 
@@ -215,16 +420,14 @@ class API(object):
 
         @return [int]: A list with the serial numbers.
         """
-        serial_numbers_len = ctypes.c_uint32(127)
-        serial_numbers = (ctypes.c_uint32 * serial_numbers_len.value)()
-        num_available = ctypes.c_uint32()
+        serial_numbers = self._serial_numbers
+        serial_numbers_len = len(serial_numbers)
+        num_available = _u32()
 
-        result = self._lib.NRFJPROG_enum_emu_snr_inst(self._handle,  ctypes.byref(serial_numbers), serial_numbers_len,
-                               ctypes.byref(num_available))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_enum_emu_snr_inst(self._handle,  serial_numbers, serial_numbers_len,
+                               _byref(num_available)))
 
-        snr = [int(serial_numbers[i]) for i in range(0, min(num_available.value, serial_numbers_len.value))]
+        snr = serial_numbers[0:min(num_available.value, serial_numbers_len)]
 
         if len(snr) == 0:
             return None
@@ -237,13 +440,7 @@ class API(object):
 
         @return boolean: True if connected.
         """
-        is_connected_to_emu = ctypes.c_bool()
-
-        result = self._lib.NRFJPROG_is_connected_to_emu_inst(self._handle,  ctypes.byref(is_connected_to_emu))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return is_connected_to_emu.value
+        return self._getters.NRFJPROG_is_connected_to_emu_inst(self._handle)
 
     def connect_to_emu_with_snr(self, serial_number, jlink_speed_khz=_DEFAULT_JLINK_SPEED_KHZ):
         """
@@ -260,11 +457,8 @@ class API(object):
 
         self._logger.set_id(serial_number)
 
-        serial_number = ctypes.c_uint32(serial_number)
-        jlink_speed_khz = ctypes.c_uint32(jlink_speed_khz)
-
         result = self._lib.NRFJPROG_connect_to_emu_with_snr_inst(self._handle,  serial_number, jlink_speed_khz)
-        if result != NrfjprogdllErr.SUCCESS:
+        if result != _SUCCESS:
             self._logger.set_id(None)
             raise APIError(result, error_data=self.get_errors())
 
@@ -277,11 +471,7 @@ class API(object):
         if not is_u32(jlink_speed_khz):
             raise ValueError('The jlink_speed_khz parameter must be an unsigned 32-bit value.')
 
-        jlink_speed_khz = ctypes.c_uint32(jlink_speed_khz)
-
-        result = self._lib.NRFJPROG_connect_to_emu_without_snr_inst(self._handle,  jlink_speed_khz)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_connect_to_emu_without_snr_inst(self._handle,  jlink_speed_khz))
 
         self._logger.set_id(self.read_connected_emu_snr())
 
@@ -289,17 +479,13 @@ class API(object):
         """
         Resets the connected emulator.
         """
-        result = self._lib.NRFJPROG_reset_connected_emu_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_reset_connected_emu_inst(self._handle))
 
     def replace_connected_emu_fw(self):
         """
         Replaces the firmware of the connected emulator.
         """
-        result = self._lib.NRFJPROG_replace_connected_emu_fw_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_replace_connected_emu_fw_inst(self._handle))
 
     def read_connected_emu_snr(self):
         """
@@ -307,13 +493,7 @@ class API(object):
 
         @return int: emu serial number.
         """
-        snr = ctypes.c_uint32()
-
-        result = self._lib.NRFJPROG_read_connected_emu_snr_inst(self._handle,  ctypes.byref(snr))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return snr.value
+        return self._getters.NRFJPROG_read_connected_emu_snr_inst(self._handle)
 
     def read_connected_emu_fwstr(self):
         """
@@ -321,12 +501,10 @@ class API(object):
         
         @return str: firmware identification string. 
         """
-        buffer_size = ctypes.c_uint32(255)
-        fwstr = ctypes.create_string_buffer(buffer_size.value)
+        buffer_size = 255
+        fwstr = ctypes.create_string_buffer(buffer_size)
 
-        result = self._lib.NRFJPROG_read_connected_emu_fwstr_inst(self._handle,  fwstr, buffer_size)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_read_connected_emu_fwstr_inst(self._handle,  fwstr, buffer_size))
 
         return fwstr.value if sys.version_info[0] == 2 else fwstr.value.decode('utf-8')
 
@@ -335,24 +513,18 @@ class API(object):
         Disconnects from an emulator.
 
         """
-        result = self._lib.NRFJPROG_disconnect_from_emu_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_disconnect_from_emu_inst(self._handle))
 
     def select_family(self, family):
         """
         Select device family
         @param DeviceFamily family: Target family for further api calls.
         """
-        if not is_enum(family, DeviceFamily):
-            raise ValueError('family Parameter must be of type int, str or DeviceFamily enumeration.')
-
         family = decode_enum(family, DeviceFamily)
-        family = ctypes.c_int(family)
+        if family is None:
+            raise ValueError('family Parameter must be of type int, str or DeviceFamily enumeration.')
 
-        result = self._lib.NRFJPROG_select_family_inst(self._handle,  family)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_select_family_inst(self._handle,  family))
 
     def is_coprocessor_enabled(self, coprocessor):
         """
@@ -360,73 +532,51 @@ class API(object):
         @param CoProcessor coprocessor: Target coprocessor for connect_to_device() call.
         @return bool: True if held in reset.
         """
-        if not is_enum(coprocessor, CoProcessor):
-            raise ValueError('CoProcessor Parameter must be of type int, str or CoProcessor enumeration.')
-
         coprocessor = decode_enum(coprocessor, CoProcessor)
-        coprocessor = ctypes.c_int(coprocessor)
-
-        held = ctypes.c_bool()
-
-        result = self._lib.NRFJPROG_is_coprocessor_enabled_inst(self._handle,  coprocessor, ctypes.byref(held))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        if coprocessor is None:
+            raise ValueError('CoProcessor Parameter must be of type int, str or CoProcessor enumeration.')
 
-        return held.value
+        return self._getters.NRFJPROG_is_coprocessor_enabled_inst(self._handle, coprocessor)
 
     def enable_coprocessor(self, coprocessor):
         """
         Enables chosen coprocessor
         @param CoProcessor coprocessor: Target coprocessor for connect_to_device() call.
         """
-        if not is_enum(coprocessor, CoProcessor):
-            raise ValueError('CoProcessor Parameter must be of type int, str or CoProcessor enumeration.')
-
         coprocessor = decode_enum(coprocessor, CoProcessor)
-        coprocessor = ctypes.c_int(coprocessor)
+        if coprocessor is None:
+            raise ValueError('CoProcessor Parameter must be of type int, str or CoProcessor enumeration.')
 
-        result = self._lib.NRFJPROG_enable_coprocessor_inst(self._handle,  coprocessor)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_enable_coprocessor_inst(self._handle,  coprocessor))
 
     def disable_coprocessor(self, coprocessor):
         """
         Disables chosen coprocessor
         @param CoProcessor coprocessor: Target coprocessor for connect_to_device() call.
         """
-        if not is_enum(coprocessor, CoProcessor):
-            raise ValueError('CoProcessor Parameter must be of type int, str or CoProcessor enumeration.')
-
         coprocessor = decode_enum(coprocessor, CoProcessor)
-        coprocessor = ctypes.c_int(coprocessor)
+        if coprocessor is None:
+            raise ValueError('CoProcessor Parameter must be of type int, str or CoProcessor enumeration.')
 
-        result = self._lib.NRFJPROG_disable_coprocessor_inst(self._handle,  coprocessor)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_disable_coprocessor_inst(self._handle,  coprocessor))
 
     def select_coprocessor(self, coprocessor):
         """
         Select coprocessor
         @param CoProcessor coprocessor: Target coprocessor for connect_to_device() call.
         """
-        if not is_enum(coprocessor, CoProcessor):
-            raise ValueError('CoProcessor Parameter must be of type int, str or CoProcessor enumeration.')
-
         coprocessor = decode_enum(coprocessor, CoProcessor)
-        coprocessor = ctypes.c_int(coprocessor)
+        if coprocessor is None:
+            raise ValueError('CoProcessor Parameter must be of type int, str or CoProcessor enumeration.')
 
-        result = self._lib.NRFJPROG_select_coprocessor_inst(self._handle,  coprocessor)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_select_coprocessor_inst(self._handle,  coprocessor))
 
     def recover(self):
         """
         Recovers the device.
 
         """
-        result = self._lib.NRFJPROG_recover_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_recover_inst(self._handle))
 
     def is_connected_to_device(self):
         """
@@ -434,31 +584,21 @@ class API(object):
 
         @return boolean: True if connected.
         """
-        is_connected_to_device = ctypes.c_bool()
-
-        result = self._lib.NRFJPROG_is_connected_to_device_inst(self._handle,  ctypes.byref(is_connected_to_device))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return is_connected_to_device.value
+        return self._getters.NRFJPROG_is_connected_to_device_inst(self._handle)
 
     def connect_to_device(self):
         """
         Connects to the nRF device.
 
         """
-        result = self._lib.NRFJPROG_connect_to_device_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_connect_to_device_inst(self._handle))
 
     def disconnect_from_device(self):
         """
         Disconnects from the device.
         
         """
-        result = self._lib.NRFJPROG_disconnect_from_device_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_disconnect_from_device_inst(self._handle))
 
     def readback_protect(self, desired_protection_level):
         """
@@ -466,20 +606,12 @@ class API(object):
 
         @param int, str, or ReadbackProtection(IntEnum) desired_protection_level: Readback protection level for the target.
         """
-        if not is_enum(desired_protection_level, ReadbackProtection):
-            raise ValueError(
-                'Parameter desired_protection_level must be of type int, str or ReadbackProtection enumeration.')
-
         desired_protection_level = decode_enum(desired_protection_level, ReadbackProtection)
         if desired_protection_level is None:
             raise ValueError(
                 'Parameter desired_protection_level must be of type int, str or ReadbackProtection enumeration.')
 
-        desired_protection_level = ctypes.c_int(desired_protection_level.value)
-
-        result = self._lib.NRFJPROG_readback_protect_inst(self._handle,  desired_protection_level)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_readback_protect_inst(self._handle,  desired_protection_level))
 
     def readback_status(self):
         """
@@ -487,21 +619,13 @@ class API(object):
 
         @return str: Readback protection level of the target.
         """
-        status = ctypes.c_int()
-
-        result = self._lib.NRFJPROG_readback_status_inst(self._handle,  ctypes.byref(status))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return ReadbackProtection(status.value).name
+        return _enum_name(_READBACK_PROTECTION_NAMES, ReadbackProtection, self._getters.NRFJPROG_readback_status_inst(self._handle))
 
     def enable_eraseprotect(self):
         """
         Protects the device against erasing.
         """
-        result = self._lib.NRFJPROG_enable_eraseprotect_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_enable_eraseprotect_inst(self._handle))
 
     def is_eraseprotect_enabled(self):
         """
@@ -509,13 +633,7 @@ class API(object):
 
         @return bool: True if erase protection is enabled.
         """
-        status = ctypes.c_bool()
-
-        result = self._lib.NRFJPROG_is_eraseprotect_enabled_inst(self._handle,  ctypes.byref(status))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return status.value
+        return self._getters.NRFJPROG_is_eraseprotect_enabled_inst(self._handle)
 
     def read_region_0_size_and_source(self):
         """
@@ -523,41 +641,29 @@ class API(object):
 
         @return (int, str): Region size and configuration source of protection (either UICR of FICR).
         """
-        size = ctypes.c_uint32()
-        source = ctypes.c_int()
-
-        result = self._lib.NRFJPROG_read_region_0_size_and_source_inst(self._handle,  ctypes.byref(size), ctypes.byref(source))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return size.value, Region0Source(source.value).name
+        size, source = self._getters.NRFJPROG_read_region_0_size_and_source_inst(self._handle)
+        return size, _enum_name(_REGION_0_SOURCE_NAMES, Region0Source, source)
 
     def debug_reset(self):
         """
         Executes a soft reset using the CTRL-AP for nRF52 and onward devices.
 
         """
-        result = self._lib.NRFJPROG_debug_reset_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_debug_reset_inst(self._handle))
 
     def sys_reset(self):
         """
         Executes a system reset request.
 
         """
-        result = self._lib.NRFJPROG_sys_reset_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_sys_reset_inst(self._handle))
 
     def pin_reset(self):
         """
         Executes a pin reset. If your device has a configurable pin reset, in order for the function execution to have the desired effect the pin reset must be enabled in UICR.PSELRESET[] registers.
 
         """
-        result = self._lib.NRFJPROG_pin_reset_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_pin_reset_inst(self._handle))
 
     def is_bprot_enabled(self, address_start, length):
         """
@@ -575,13 +681,9 @@ class API(object):
         if not is_u32(length):
             raise ValueError('The length parameter must be an unsigned 32-bit value.')
 
-        address_start = ctypes.c_uint32(address_start)
-        length = ctypes.c_uint32(length)
-        bprot_enabled = ctypes.c_bool(False)
+        bprot_enabled = _bool(False)
 
-        result = self._lib.NRFJPROG_is_bprot_enabled_inst(self._handle,  ctypes.byref(bprot_enabled), address_start, length)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_is_bprot_enabled_inst(self._handle,  _byref(bprot_enabled), address_start, length))
 
         return bprot_enabled.value
 
@@ -590,18 +692,14 @@ class API(object):
         Disables BPROT, ACL or NVM protection blocks where appropriate depending on device.
 
         """
-        result = self._lib.NRFJPROG_disable_bprot_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_disable_bprot_inst(self._handle))
 
     def erase_all(self):
         """
         Erases all code and UICR flash.
 
         """
-        result = self._lib.NRFJPROG_erase_all_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_erase_all_inst(self._handle))
 
     def erase_page(self, addr):
         """
@@ -612,20 +710,14 @@ class API(object):
         if not is_u32(addr):
             raise ValueError('The addr parameter must be an unsigned 32-bit value.')
 
-        addr = ctypes.c_uint32(addr)
-
-        result = self._lib.NRFJPROG_erase_page_inst(self._handle,  addr)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_erase_page_inst(self._handle,  addr))
 
     def erase_uicr(self):
         """
         Erases UICR info page.
 
         """
-        result = self._lib.NRFJPROG_erase_uicr_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_erase_uicr_inst(self._handle))
 
     def write_u32(self, addr, data, control):
         """
@@ -644,13 +736,30 @@ class API(object):
         if not is_bool(control):
             raise ValueError('The control parameter must be a boolean value.')
 
-        addr = ctypes.c_uint32(addr)
-        data = ctypes.c_uint32(data)
-        control = ctypes.c_bool(control)
+        self._check(self._lib.NRFJPROG_write_u32_inst(self._handle,  addr, data, control))
 
-        result = self._lib.NRFJPROG_write_u32_inst(self._handle,  addr, data, control)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+    def write_many_u32(self, addr, values, control):
+        """
+        Writes consecutive uint32_t values into the device starting at the given address, using a single DLL call.
+
+        @param int addr: Start address of the memory block to write.
+        @param sequence values: Values to write. Any iterable of unsigned 32-bit values, such as a list or an array.array, is valid as input.
+        @param boolean control: True for automatic control of NVMC by the function.
+        """
+        if not is_u32(addr):
+            raise ValueError('The addr parameter must be an unsigned 32-bit value.')
+
+        words = to_uint32_array(values)
+        if words is None:
+            raise ValueError('The values parameter must be a sequence of unsigned 32-bit values with at least one item.')
+
+        if not is_bool(control):
+            raise ValueError('The control parameter must be a boolean value.')
+
+        data_len = len(words) * words.itemsize
+        data = (_u8 * data_len).from_buffer(words)
+
+        self._check(self._lib.NRFJPROG_write_inst(self._handle,  addr, data, data_len, control))
 
     def read_u32(self, addr):
         """
@@ -662,14 +771,7 @@ class API(object):
         if not is_u32(addr):
             raise ValueError('The addr parameter must be an unsigned 32-bit value.')
 
-        addr = ctypes.c_uint32(addr)
-        data = ctypes.c_uint32()
-
-        result = self._lib.NRFJPROG_read_u32_inst(self._handle,  addr, ctypes.byref(data))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return data.value
+        return self._getters.NRFJPROG_read_u32_inst(self._handle, addr)
 
     def write(self, addr, data, control):
         """
@@ -682,44 +784,68 @@ class API(object):
         if not is_u32(addr):
             raise ValueError('The addr parameter must be an unsigned 32-bit value.')
 
-        if not is_valid_buf(data):
+        data = to_uint8_array(data)
+        if data is None:
             raise ValueError('The data parameter must be a sequence type with at least one item.')
 
         if not is_bool(control):
             raise ValueError('The control parameter must be a boolean value.')
 
-        addr = ctypes.c_uint32(addr)
-        data_len = ctypes.c_uint32(len(data))
-        data = (ctypes.c_uint8 * data_len.value)(*data)
-        control = ctypes.c_bool(control)
+        data_len = len(data)
 
-        result = self._lib.NRFJPROG_write_inst(self._handle,  addr, ctypes.byref(data), data_len, control)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_write_inst(self._handle,  addr, data, data_len, control))
 
     def read(self, addr, data_len):
         """
         Reads data_len bytes from the device starting at the given address.
 
+        Kept for backwards compatibility. Use read_bytes() when the data does not need to be a list, as it avoids
+        creating one Python object per byte read.
+
         @param int addr: Start address of the memory block to read.
         @param int data_len: Number of bytes to read.
         @return [int]: List of values read.
         """
+        return list(self.read_bytes(addr, data_len))
+
+    def read_bytes(self, addr, data_len):
+        """
+        Reads data_len bytes from the device starting at the given address.
+
+        @param int addr: Start address of the memory block to read.
+        @param int data_len: Number of bytes to read.
+        @return bytes: Data read.
+        """
         if not is_u32(addr):
             raise ValueError('The addr parameter must be an unsigned 32-bit value.')
 
         if not is_u32(data_len):
             raise ValueError('The data_len parameter must be an unsigned 32-bit value.')
 
-        addr = ctypes.c_uint32(addr)
-        data_len = ctypes.c_uint32(data_len)
-        data = (ctypes.c_uint8 * data_len.value)()
+        # The DLL writes through a uint8 view of the char buffer, whose raw contents are returned as bytes.
+        data = ctypes.create_string_buffer(data_len)
 
-        result = self._lib.NRFJPROG_read_inst(self._handle,  addr, ctypes.byref(data), data_len)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_read_inst(self._handle,  addr, (_u8 * data_len).from_buffer(data), data_len))
+
+        return data.raw
+
+    def read_into(self, addr, buf):
+        """
+        Reads len(buf) bytes from the device starting at the given address directly into buf, without allocating an intermediate buffer.
+
+        @param int addr: Start address of the memory block to read.
+        @param buffer buf: Writable, C-contiguous buffer to read into, e.g. a bytearray, array.array or numpy array. Its whole size in bytes is read.
+        """
+        if not is_u32(addr):
+            raise ValueError('The addr parameter must be an unsigned 32-bit value.')
 
-        return list(data)
+        data = to_uint8_view(buf)
+        if data is None:
+            raise ValueError('The buf parameter must be a writable, C-contiguous buffer of at most 0xFFFFFFFF bytes.')
+
+        data_len = len(data)
+
+        self._check(self._lib.NRFJPROG_read_inst(self._handle,  addr, data, data_len))
 
     def is_halted(self):
         """
@@ -727,22 +853,14 @@ class API(object):
 
         @return boolean: True if halted.
         """
-        is_halted = ctypes.c_bool()
-
-        result = self._lib.NRFJPROG_is_halted_inst(self._handle,  ctypes.byref(is_halted))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return is_halted.value
+        return self._getters.NRFJPROG_is_halted_inst(self._handle)
 
     def halt(self):
         """
         Halts the device CPU.
 
         """
-        result = self._lib.NRFJPROG_halt_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_halt_inst(self._handle))
 
     def run(self, pc, sp):
         """
@@ -757,30 +875,21 @@ class API(object):
         if not is_u32(sp):
             raise ValueError('The sp parameter must be an unsigned 32-bit value.')
 
-        pc = ctypes.c_uint32(pc)
-        sp = ctypes.c_uint32(sp)
-
-        result = self._lib.NRFJPROG_run_inst(self._handle,  pc, sp)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_run_inst(self._handle,  pc, sp))
 
     def go(self):
         """
         Starts the device CPU.
 
         """
-        result = self._lib.NRFJPROG_go_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_go_inst(self._handle))
 
     def step(self):
         """
         Runs the device CPU for one instruction.
 
         """
-        result = self._lib.NRFJPROG_step_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_step_inst(self._handle))
 
     def read_ram_sections_count(self):
         """
@@ -788,13 +897,7 @@ class API(object):
 
         @return int: number of RAM sections in the device
         """
-        count = ctypes.c_uint32()
-
-        result = self._lib.NRFJPROG_read_ram_sections_count_inst(self._handle,  ctypes.byref(count))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return count.value
+        return self._getters.NRFJPROG_read_ram_sections_count_inst(self._handle)
 
     def read_ram_sections_size(self):
         """
@@ -802,14 +905,12 @@ class API(object):
 
         @return [int]: List containing the size of each RAM power section. The length of the list is equal to the number of ram sections in the device.
         """
-        sections_size_list_size = ctypes.c_uint32(self.read_ram_sections_count())
-        sections_size = (ctypes.c_uint32 * sections_size_list_size.value)()
+        sections_size_list_size = self.read_ram_sections_count()
+        sections_size = (_u32 * sections_size_list_size)()
 
-        result = self._lib.NRFJPROG_read_ram_sections_size_inst(self._handle,  ctypes.byref(sections_size), sections_size_list_size)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_read_ram_sections_size_inst(self._handle,  sections_size, sections_size_list_size))
 
-        return list(sections_size)
+        return sections_size[:]
 
     def read_ram_sections_power_status(self):
         """
@@ -817,14 +918,14 @@ class API(object):
 
         @return [str]: List containing the power status of each RAM power section. The length of the list is equal to the number of ram sections in the device.
         """
-        status_size = ctypes.c_uint32(self.read_ram_sections_count())
-        status = (ctypes.c_uint32 * status_size.value)()
+        status_size = self.read_ram_sections_count()
+        if len(self._ram_power_status) < status_size:
+            self._ram_power_status = (_enum * status_size)()
+        status = self._ram_power_status
 
-        result = self._lib.NRFJPROG_read_ram_sections_power_status_inst(self._handle,  ctypes.byref(status), status_size)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_read_ram_sections_power_status_inst(self._handle,  status, status_size))
 
-        return [RamPower(elem).name for elem in list(status)]
+        return [_enum_name(_RAM_POWER_NAMES, RamPower, elem) for elem in status[0:status_size]]
 
 
     def power_ram_all(self):
@@ -832,9 +933,7 @@ class API(object):
         Powers up all RAM sections of the device.
 
         """
-        result = self._lib.NRFJPROG_power_ram_all_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_power_ram_all_inst(self._handle))
 
     def unpower_ram_section(self, section_index):
         """
@@ -845,11 +944,7 @@ class API(object):
         if not is_u32(section_index):
             raise ValueError('The section_index parameter must be an unsigned 32-bit value.')
 
-        section_index = ctypes.c_uint32(section_index)
-
-        result = self._lib.NRFJPROG_unpower_ram_section_inst(self._handle,  section_index)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_unpower_ram_section_inst(self._handle,  section_index))
 
     def read_memory_descriptors(self, read_page_sizes=True):
         """
@@ -859,9 +954,9 @@ class API(object):
         @return: list of Parameters.MemoryDescription: Memory descriptors read.
         """
         # Start by obtaining the number of memories available
-        num_available = ctypes.c_uint32()
-        result = self._lib.NRFJPROG_read_memory_descriptors_inst(self._handle, None, ctypes.c_uint32(0), ctypes.byref(num_available))
-        if result != NrfjprogdllErr.SUCCESS:
+        num_available = _u32()
+        result = self._lib.NRFJPROG_read_memory_descriptors_inst(self._handle, None, 0, _byref(num_available))
+        if result != _SUCCESS:
             raise APIError(result)
 
         # Skip read if nothing is available
@@ -870,8 +965,8 @@ class API(object):
 
         # Perform the read
         memory_description_arr = (MemoryDescriptionStruct * num_available.value)()
-        result = self._lib.NRFJPROG_read_memory_descriptors_inst(self._handle, ctypes.byref(memory_description_arr), num_available, ctypes.byref(num_available))
-        if result != NrfjprogdllErr.SUCCESS:
+        result = self._lib.NRFJPROG_read_memory_descriptors_inst(self._handle, memory_description_arr, num_available, _byref(num_available))
+        if result != _SUCCESS:
             raise APIError(result)
 
         result = [MemoryDescription(mem_description) for mem_description in memory_description_arr[0:num_available.value]]
@@ -893,9 +988,9 @@ class API(object):
             raise ValueError("Parameter memory_description must be of type MemoryDescription.")
 
         # Start by obtaining the number of memories available
-        num_available = ctypes.c_uint32()
-        result = self._lib.NRFJPROG_read_page_sizes_inst(self._handle, ctypes.byref(memory_description._cstruct), None, ctypes.c_uint32(0), ctypes.byref(num_available))
-        if result != NrfjprogdllErr.SUCCESS:
+        num_available = _u32()
+        result = self._lib.NRFJPROG_read_page_sizes_inst(self._handle, _byref(memory_description._cstruct), None, 0, _byref(num_available))
+        if result != _SUCCESS:
             raise APIError(result)
 
         # Skip read if nothing is available
@@ -904,8 +999,8 @@ class API(object):
 
         # Perform the read
         page_repetitions_arr = (PageRepetitionsStruct * num_available.value)()
-        result = self._lib.NRFJPROG_read_page_sizes_inst(self._handle, ctypes.byref(memory_description._cstruct), ctypes.byref(page_repetitions_arr), num_available, ctypes.byref(num_available))
-        if result != NrfjprogdllErr.SUCCESS:
+        result = self._lib.NRFJPROG_read_page_sizes_inst(self._handle, _byref(memory_description._cstruct), page_repetitions_arr, num_available, _byref(num_available))
+        if result != _SUCCESS:
             raise APIError(result)
 
         return [PageRepetitions(page_rep) for page_rep in page_repetitions_arr[0:num_available.value]]
@@ -917,21 +1012,11 @@ class API(object):
         @param  int, str, or CPURegister(IntEnum) register_name: CPU register to read.
         @return int: Value read.
         """
-        if not is_enum(register_name, CpuRegister):
-            raise ValueError('Parameter register_name must be of type int, str or CpuRegister enumeration.')
-
         register_name = decode_enum(register_name, CpuRegister)
         if register_name is None:
             raise ValueError('Parameter register_name must be of type int, str or CpuRegister enumeration.')
 
-        register_name = ctypes.c_int(register_name.value)
-        value = ctypes.c_uint32()
-
-        result = self._lib.NRFJPROG_read_cpu_register_inst(self._handle, register_name, ctypes.byref(value))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return value.value
+        return self._getters.NRFJPROG_read_cpu_register_inst(self._handle, register_name)
 
     def write_cpu_register(self, register_name, value):
         """
@@ -943,19 +1028,11 @@ class API(object):
         if not is_u32(value):
             raise ValueError('The value parameter must be an unsigned 32-bit value.')
 
-        if not is_enum(register_name, CpuRegister):
-            raise ValueError('Parameter register_name must be of type int, str or CpuRegister enumeration.')
-
         register_name = decode_enum(register_name, CpuRegister)
         if register_name is None:
             raise ValueError('Parameter register_name must be of type int, str or CpuRegister enumeration.')
 
-        register_name = ctypes.c_int(register_name.value)
-        value = ctypes.c_uint32(value)
-
-        result = self._lib.NRFJPROG_write_cpu_register_inst(self._handle, register_name, value)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_write_cpu_register_inst(self._handle, register_name, value))
 
     def read_device_version(self):
         """
@@ -963,24 +1040,16 @@ class API(object):
 
         @return str: Version of the target device.
         """
-        version = ctypes.c_int()
-
-        result = self._lib.NRFJPROG_read_device_version_inst(self._handle,  ctypes.byref(version))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return DeviceVersion(version.value).name
+        return _enum_name(_DEVICE_VERSION_NAMES, DeviceVersion, self._getters.NRFJPROG_read_device_version_inst(self._handle))
 
     def read_device_info(self):
 
-        version = ctypes.c_int()
-        name = ctypes.c_int()
-        memory = ctypes.c_int()
-        revision = ctypes.c_int()
-        result = self._lib.NRFJPROG_read_device_info_inst(self._handle,  ctypes.byref(version), ctypes.byref(name),
-                               ctypes.byref(memory), ctypes.byref(revision))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        version = _enum()
+        name = _enum()
+        memory = _enum()
+        revision = _enum()
+        self._check(self._lib.NRFJPROG_read_device_info_inst(self._handle,  _byref(version), _byref(name),
+                               _byref(memory), _byref(revision)))
 
         return DeviceVersion(version.value), DeviceName(name.value), DeviceMemory(memory.value), DeviceRevision(
             revision.value)
@@ -991,13 +1060,7 @@ class API(object):
 
         @return str: Family of the target device.
         """
-        family = ctypes.c_int()
-
-        result = self._lib.NRFJPROG_read_device_family_inst(self._handle,  ctypes.byref(family))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return DeviceFamily(family.value).name
+        return _enum_name(_DEVICE_FAMILY_NAMES, DeviceFamily, self._getters.NRFJPROG_read_device_family_inst(self._handle))
 
     def read_debug_port_register(self, addr):
         """
@@ -1009,14 +1072,7 @@ class API(object):
         if not is_u8(addr):
             raise ValueError('The addr parameter must be an unsigned 8-bit value.')
 
-        addr = ctypes.c_uint8(addr)
-        data = ctypes.c_uint32()
-
-        result = self._lib.NRFJPROG_read_debug_port_register_inst(self._handle,  addr, ctypes.byref(data))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return data.value
+        return self._getters.NRFJPROG_read_debug_port_register_inst(self._handle, addr)
 
     def write_debug_port_register(self, addr, data):
         """
@@ -1031,12 +1087,7 @@ class API(object):
         if not is_u32(data):
             raise ValueError('The data parameter must be an unsigned 32-bit value.')
 
-        addr = ctypes.c_uint8(addr)
-        data = ctypes.c_uint32(data)
-
-        result = self._lib.NRFJPROG_write_debug_port_register_inst(self._handle,  addr, data)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_write_debug_port_register_inst(self._handle,  addr, data))
 
     def read_access_port_register(self, ap_index, addr):
         """
@@ -1052,15 +1103,7 @@ class API(object):
         if not is_u8(addr):
             raise ValueError('The addr parameter must be an unsigned 8-bit value.')
 
-        ap_index = ctypes.c_uint8(ap_index)
-        addr = ctypes.c_uint8(addr)
-        data = ctypes.c_uint32()
-
-        result = self._lib.NRFJPROG_read_access_port_register_inst(self._handle,  ap_index, addr, ctypes.byref(data))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return data.value
+        return self._getters.NRFJPROG_read_access_port_register_inst(self._handle, ap_index, addr)
 
     def write_access_port_register(self, ap_index, addr, data):
         """
@@ -1079,13 +1122,7 @@ class API(object):
         if not is_u32(data):
             raise ValueError('The data parameter must be an unsigned 32-bit value.')
 
-        ap_index = ctypes.c_uint8(ap_index)
-        addr = ctypes.c_uint8(addr)
-        data = ctypes.c_uint32(data)
-
-        result = self._lib.NRFJPROG_write_access_port_register_inst(self._handle,  ap_index, addr, data)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_write_access_port_register_inst(self._handle,  ap_index, addr, data))
 
     def is_rtt_started(self):
         """
@@ -1093,13 +1130,7 @@ class API(object):
 
         @return bool: True if started.
         """
-        started = ctypes.c_bool()
-
-        result = self._lib.NRFJPROG_is_rtt_started_inst(self._handle,  ctypes.byref(started))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return started.value
+        return self._getters.NRFJPROG_is_rtt_started_inst(self._handle)
 
     def rtt_set_control_block_address(self, addr):
         """
@@ -1110,20 +1141,14 @@ class API(object):
         if not is_u32(addr):
             raise ValueError('The address parameter must be an unsigned 32-bit value.')
 
-        addr = ctypes.c_uint32(addr)
-
-        result = self._lib.NRFJPROG_rtt_set_control_block_address_inst(self._handle,  addr)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_rtt_set_control_block_address_inst(self._handle,  addr))
 
     def rtt_start(self):
         """
         Starts RTT.
 
         """
-        result = self._lib.NRFJPROG_rtt_start_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_rtt_start_inst(self._handle))
 
     def rtt_is_control_block_found(self):
         """
@@ -1131,22 +1156,14 @@ class API(object):
 
         @return boolean: True if found.
         """
-        is_control_block_found = ctypes.c_bool()
-
-        result = self._lib.NRFJPROG_rtt_is_control_block_found_inst(self._handle,  ctypes.byref(is_control_block_found))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return is_control_block_found.value
+        return self._getters.NRFJPROG_rtt_is_control_block_found_inst(self._handle)
 
     def rtt_stop(self):
         """
         Stops RTT.
 
         """
-        result = self._lib.NRFJPROG_rtt_stop_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_rtt_stop_inst(self._handle))
 
     def rtt_read(self, channel_index, length, encoding='utf-8'):
         """
@@ -1166,22 +1183,55 @@ class API(object):
         if encoding is not None and not is_valid_encoding(encoding):
             raise ValueError('The encoding parameter must be either None or a standard encoding in python.')
 
-        channel_index = ctypes.c_uint32(channel_index)
-        length = ctypes.c_uint32(length)
-        data = (ctypes.c_uint8 * length.value)()
-        data_read = ctypes.c_uint32()
+        if len(self._rtt_read_buffer) < length:
+            self._rtt_read_buffer = (_u8 * length)()
+        data = self._rtt_read_buffer
+        data_read = self._rtt_data_read
 
-        result = self._lib.NRFJPROG_rtt_read_inst(self._handle,  channel_index, ctypes.byref(data), length, ctypes.byref(data_read))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_rtt_read_inst(self._handle,  channel_index, data, length, _byref(data_read)))
 
-        if encoding is None:
-            return bytearray(data[0:data_read.value])
-        else:
-            if sys.version_info[0] == 2:
-                return bytearray(data[0:data_read.value]).decode(encoding).encode('utf-8')
-            else:
-                return bytearray(data[0:data_read.value]).decode(encoding)
+        return decode_rtt_data(data, data_read.value, encoding)
+
+    def rtt_read_multi(self, channel_index, length, max_iterations=16, encoding='utf-8'):
+        """
+        Reads from an RTT channel repeatedly, until the channel has no more data, length bytes have been read or max_iterations reads have been made.
+
+        @param int channel_index: RTT channel to read.
+        @param int length: Maximum total number of bytes to read.
+        @param (optional) int max_iterations: Maximum number of reads to make. Default value 16.
+        @param (optional) str or None encoding: Encoding for the data read in order to build a readable string. Default value 'utf-8'.
+        @return str or bytearray: Data read. Return type depends on encoding optional parameter, see rtt_read().
+        """
+        if not is_u32(channel_index):
+            raise ValueError('The channel_index parameter must be an unsigned 32-bit value.')
+
+        if not is_u32(length):
+            raise ValueError('The length parameter must be an unsigned 32-bit value.')
+
+        if not is_u32(max_iterations):
+            raise ValueError('The max_iterations parameter must be an unsigned 32-bit value.')
+
+        if encoding is not None and not is_valid_encoding(encoding):
+            raise ValueError('The encoding parameter must be either None or a standard encoding in python.')
+
+        if len(self._rtt_read_buffer) < length:
+            self._rtt_read_buffer = (_u8 * length)()
+        data = self._rtt_read_buffer
+        data_read = self._rtt_data_read
+
+        total = 0
+        for _ in range(max_iterations):
+            remaining = length - total
+            if remaining == 0:
+                break
+
+            chunk = (_u8 * remaining).from_buffer(data, total)
+            self._check(self._lib.NRFJPROG_rtt_read_inst(self._handle,  channel_index, chunk, remaining, _byref(data_read)))
+            if data_read.value == 0:
+                break
+            total += data_read.value
+
+        return decode_rtt_data(data, total, encoding)
 
     def rtt_write(self, channel_index, msg, encoding='utf-8'):
         """
@@ -1198,19 +1248,14 @@ class API(object):
         if encoding is not None and not is_valid_encoding(encoding):
             raise ValueError('The encoding parameter must be either None or a standard encoding in python.')
 
-        msg = bytearray(msg.encode(encoding)) if encoding else bytearray(msg)
-        if not is_valid_buf(msg):
+        data = encode_rtt_message(msg, encoding)
+        if data is None:
             raise ValueError('The msg parameter must be a sequence type with at least one item.')
 
-        channel_index = ctypes.c_uint32(channel_index)
-        length = ctypes.c_uint32(len(msg))
-        data = (ctypes.c_uint8 * length.value)(*msg)
-        data_written = ctypes.c_uint32()
+        data_written = self._rtt_data_written
 
-        result = self._lib.NRFJPROG_rtt_write_inst(self._handle,  channel_index, ctypes.byref(data), length,
-                               ctypes.byref(data_written))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_rtt_write_inst(self._handle,  channel_index, data, len(data),
+                               _byref(data_written)))
 
         return data_written.value
 
@@ -1220,15 +1265,7 @@ class API(object):
 
         @return (int, int): Tuple containing the number of down RTT channels and the number of up RTT channels.
         """
-        down_channel_number = ctypes.c_uint32()
-        up_channel_number = ctypes.c_uint32()
-
-        result = self._lib.NRFJPROG_rtt_read_channel_count_inst(self._handle,  ctypes.byref(down_channel_number),
-                               ctypes.byref(up_channel_number))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return down_channel_number.value, up_channel_number.value
+        return self._getters.NRFJPROG_rtt_read_channel_count_inst(self._handle)
 
     def rtt_read_channel_info(self, channel_index, direction):
         """
@@ -1241,25 +1278,18 @@ class API(object):
         if not is_u32(channel_index):
             raise ValueError('The channel_index parameter must be an unsigned 32-bit value.')
 
-        if not is_enum(direction, RTTChannelDirection):
-            raise ValueError('Parameter direction must be of type int, str or RTTChannelDirection enumeration.')
-
         direction = decode_enum(direction, RTTChannelDirection)
         if direction is None:
             raise ValueError('Parameter direction must be of type int, str or RTTChannelDirection enumeration.')
 
-        channel_index = ctypes.c_uint32(channel_index)
-        direction = ctypes.c_int(direction.value)
-        name_len = ctypes.c_uint32(32)
-        name = (ctypes.c_uint8 * 32)()
-        size = ctypes.c_uint32()
+        name_len = 32
+        name = (_u8 * 32)()
+        size = _u32()
 
-        result = self._lib.NRFJPROG_rtt_read_channel_info_inst(self._handle,  channel_index, direction, ctypes.byref(name), name_len,
-                               ctypes.byref(size))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_rtt_read_channel_info_inst(self._handle,  channel_index, direction, name, name_len,
+                               _byref(size)))
 
-        return ''.join(chr(i) for i in name if i != 0), size.value
+        return bytes(name).split(b'\x00', 1)[0].decode('latin-1'), size.value
 
     def is_qspi_init(self):
         """
@@ -1267,13 +1297,7 @@ class API(object):
 
         @return bool: True if initialized.
         """
-        initialized = ctypes.c_bool()
-
-        result = self._lib.NRFJPROG_is_qspi_init_inst(self._handle,  ctypes.byref(initialized))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return initialized.value
+        return self._getters.NRFJPROG_is_qspi_init_inst(self._handle)
 
     def qspi_init(self, retain_ram=False, init_params=None):
         """
@@ -1283,32 +1307,6 @@ class API(object):
         @param (optional) QSPIInitParams init_params: Configuration for the QSPI operations.
         """
 
-        class _CtypesQSPIInitParams(ctypes.Structure):
-            _fields_ = [
-                ("read_mode", ctypes.c_int),
-                ("write_mode", ctypes.c_int),
-                ("address_mode", ctypes.c_int),
-                ("frequency", ctypes.c_int),
-                ("spi_mode", ctypes.c_int),
-                ("sck_delay", ctypes.c_uint32),
-                ("custom_instruction_io2_level", ctypes.c_int),
-                ("custom_instruction_io3_level", ctypes.c_int),
-                ("CSN_pin", ctypes.c_uint32),
-                ("CSN_port", ctypes.c_uint32),
-                ("SCK_pin", ctypes.c_uint32),
-                ("SCK_port", ctypes.c_uint32),
-                ("DIO0_pin", ctypes.c_uint32),
-                ("DIO0_port", ctypes.c_uint32),
-                ("DIO1_pin", ctypes.c_uint32),
-                ("DIO1_port", ctypes.c_uint32),
-                ("DIO2_pin", ctypes.c_uint32),
-                ("DIO2_port", ctypes.c_uint32),
-                ("DIO3_pin", ctypes.c_uint32),
-                ("DIO3_port", ctypes.c_uint32),
-                ("WIP_index", ctypes.c_uint32),
-                ("pp_size", ctypes.c_int)
-            ]
-
         if not is_bool(retain_ram):
             raise ValueError('The retain_ram parameter must be a boolean value.')
 
@@ -1318,35 +1316,7 @@ class API(object):
         if init_params is None:
             init_params = QSPIInitParams()
 
-        retain_ram = ctypes.c_bool(retain_ram)
-        qspi_init_params = _CtypesQSPIInitParams(
-            init_params.read_mode,
-            init_params.write_mode,
-            init_params.address_mode,
-            init_params.frequency,
-            init_params.spi_mode,
-            init_params.sck_delay,
-            init_params.custom_instruction_io2_level,
-            init_params.custom_instruction_io3_level,
-            init_params.CSN_pin,
-            init_params.CSN_port,
-            init_params.SCK_pin,
-            init_params.SCK_port,
-            init_params.DIO0_pin,
-            init_params.DIO0_port,
-            init_params.DIO1_pin,
-            init_params.DIO1_port,
-            init_params.DIO2_pin,
-            init_params.DIO2_port,
-            init_params.DIO3_pin,
-            init_params.DIO3_port,
-            init_params.WIP_index,
-            init_params.pp_size
-        )
-
-        result = self._lib.NRFJPROG_qspi_init_inst(self._handle,  retain_ram, ctypes.byref(qspi_init_params))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_qspi_init_inst(self._handle,  retain_ram, _byref(init_params)))
 
     def qspi_init_ini(self, ini_path=QSPIIniFile):
         """
@@ -1355,10 +1325,8 @@ class API(object):
 
         @param Path ini_path: Path to ini file containing qspi setup.
         """
-        ini_path = str(ini_path).encode('utf-8')
-        result = self._lib.NRFJPROG_qspi_init_ini_inst(self._handle, ini_path)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        ini_path = encode_path(ini_path)
+        self._check(self._lib.NRFJPROG_qspi_init_ini_inst(self._handle, ini_path))
 
     def qspi_start(self):
         """
@@ -1366,9 +1334,7 @@ class API(object):
         QSPI peripheral must be configured before calling this function, see functions 'qspi_configure' and 'qspi_configure_ini'.
         The QSPi peripheral can be configured and initialized in the same operation using functions 'qspi_init' or 'qspi_init_ini'.
         """
-        result = self._lib.NRFJPROG_qspi_start_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_qspi_start_inst(self._handle))
 
     def qspi_configure(self, retain_ram=False, init_params=None):
         """
@@ -1377,32 +1343,6 @@ class API(object):
         @param (optional) bool retain_ram: Retain contents of device RAM used in the QSPI operations. RAM contents will be restored in qspi_uninit() operation.
         @param (optional) QSPIInitParams init_params: Configuration for the QSPI operations.
         """
-        class _CtypesQSPIInitParams(ctypes.Structure):
-            _fields_ = [
-                ("read_mode", ctypes.c_int),
-                ("write_mode", ctypes.c_int),
-                ("address_mode", ctypes.c_int),
-                ("frequency", ctypes.c_int),
-                ("spi_mode", ctypes.c_int),
-                ("sck_delay", ctypes.c_uint32),
-                ("custom_instruction_io2_level", ctypes.c_int),
-                ("custom_instruction_io3_level", ctypes.c_int),
-                ("CSN_pin", ctypes.c_uint32),
-                ("CSN_port", ctypes.c_uint32),
-                ("SCK_pin", ctypes.c_uint32),
-                ("SCK_port", ctypes.c_uint32),
-                ("DIO0_pin", ctypes.c_uint32),
-                ("DIO0_port", ctypes.c_uint32),
-                ("DIO1_pin", ctypes.c_uint32),
-                ("DIO1_port", ctypes.c_uint32),
-                ("DIO2_pin", ctypes.c_uint32),
-                ("DIO2_port", ctypes.c_uint32),
-                ("DIO3_pin", ctypes.c_uint32),
-                ("DIO3_port", ctypes.c_uint32),
-                ("WIP_index", ctypes.c_uint32),
-                ("pp_size", ctypes.c_int)
-            ]
-
         if not is_bool(retain_ram):
             raise ValueError('The retain_ram parameter must be a boolean value.')
 
@@ -1412,35 +1352,7 @@ class API(object):
         if init_params is None:
             init_params = QSPIInitParams()
 
-        retain_ram = ctypes.c_bool(retain_ram)
-        qspi_init_params = _CtypesQSPIInitParams(
-            init_params.read_mode,
-            init_params.write_mode,
-            init_params.address_mode,
-            init_params.frequency,
-            init_params.spi_mode,
-            init_params.sck_delay,
-            init_params.custom_instruction_io2_level,
-            init_params.custom_instruction_io3_level,
-            init_params.CSN_pin,
-            init_params.CSN_port,
-            init_params.SCK_pin,
-            init_params.SCK_port,
-            init_params.DIO0_pin,
-            init_params.DIO0_port,
-            init_params.DIO1_pin,
-            init_params.DIO1_port,
-            init_params.DIO2_pin,
-            init_params.DIO2_port,
-            init_params.DIO3_pin,
-            init_params.DIO3_port,
-            init_params.WIP_index,
-            init_params.pp_size
-        )
-
-        result = self._lib.NRFJPROG_qspi_configure_inst(self._handle,  retain_ram, ctypes.byref(qspi_init_params))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_qspi_configure_inst(self._handle,  retain_ram, _byref(init_params)))
 
     def qspi_configure_ini(self, ini_path=QSPIIniFile):
         """
@@ -1449,19 +1361,15 @@ class API(object):
 
         @param Path ini_path: Path to ini file containing qspi setup.
         """
-        ini_path = str(ini_path).encode('utf-8')
-        result = self._lib.NRFJPROG_qspi_configure_ini_inst(self._handle, ini_path)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        ini_path = encode_path(ini_path)
+        self._check(self._lib.NRFJPROG_qspi_configure_ini_inst(self._handle, ini_path))
 
     def qspi_uninit(self):
         """
         Uninitializes the QSPI peripheral.
         
         """
-        result = self._lib.NRFJPROG_qspi_uninit_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_qspi_uninit_inst(self._handle))
 
     def qspi_set_rx_delay(self, rx_delay):
         """
@@ -1473,11 +1381,7 @@ class API(object):
         if not is_u8(rx_delay):
             raise ValueError('The rx_delay parameter must be an unsigned 8-bit value.')
 
-        rx_delay = ctypes.c_uint8(rx_delay)
-
-        result = self._lib.NRFJPROG_qspi_set_rx_delay_inst(self._handle,  rx_delay)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_qspi_set_rx_delay_inst(self._handle,  rx_delay))
 
     def qspi_set_size(self, size):
         """
@@ -1488,21 +1392,13 @@ class API(object):
         if not is_u32(size):
             raise ValueError("The size parameter must be an unsigned 32-bit value")
 
-        size = ctypes.c_uint32(size)
-        result = self._lib.NRFJPROG_qspi_set_size_inst(self._handle, size)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_qspi_set_size_inst(self._handle, size))
 
     def qspi_get_size(self):
         """
         Get previously configured QSPI size.
         """
-        size = ctypes.c_uint32(0)
-        result = self._lib.NRFJPROG_qspi_get_size_inst(self._handle, ctypes.byref(size))
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
-
-        return size.value
+        return self._getters.NRFJPROG_qspi_get_size_inst(self._handle)
 
     def qspi_read(self, addr, length):
         """
@@ -1518,13 +1414,9 @@ class API(object):
         if not is_u32(length):
             raise ValueError('The length parameter must be an unsigned 32-bit value.')
 
-        addr = ctypes.c_uint32(addr)
-        length = ctypes.c_uint32(length)
-        data = (ctypes.c_uint8 * length.value)()
+        data = (_u8 * length)()
 
-        result = self._lib.NRFJPROG_qspi_read_inst(self._handle,  addr, ctypes.byref(data), length)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_qspi_read_inst(self._handle,  addr, data, length))
 
         return bytearray(data)
 
@@ -1538,16 +1430,13 @@ class API(object):
         if not is_u32(addr):
             raise ValueError('The addr parameter must be an unsigned 32-bit value.')
 
-        if not is_valid_buf(data):
+        data = to_uint8_array(data)
+        if data is None:
             raise ValueError('The data parameter must be a sequence type with at least one item.')
 
-        addr = ctypes.c_uint32(addr)
-        data_len = ctypes.c_uint32(len(data))
-        data = (ctypes.c_uint8 * data_len.value)(*data)
+        data_len = len(data)
 
-        result = self._lib.NRFJPROG_qspi_write_inst(self._handle,  addr, ctypes.byref(data), data_len)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_qspi_write_inst(self._handle,  addr, data, data_len))
 
     def qspi_erase(self, addr, length):
         """
@@ -1559,19 +1448,11 @@ class API(object):
         if not is_u32(addr):
             raise ValueError('The addr parameter must be an unsigned 32-bit value.')
 
-        if not is_enum(length, QSPIEraseLen):
-            raise ValueError('Parameter length must be of type int, str or QSPIEraseLen enumeration.')
-
         length = decode_enum(length, QSPIEraseLen)
         if length is None:
             raise ValueError('Parameter length must be of type int, str or QSPIEraseLen enumeration.')
 
-        addr = ctypes.c_uint32(addr)
-        length = ctypes.c_int(length)
-
-        result = self._lib.NRFJPROG_qspi_erase_inst(self._handle,  addr, length)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_qspi_erase_inst(self._handle,  addr, length))
 
     def qspi_custom(self, code, length, data_in=None, output=False):
         """
@@ -1589,22 +1470,22 @@ class API(object):
         if not is_u32(length):
             raise ValueError('The length parameter must be an unsigned 32-bit value.')
 
-        if not is_valid_buf(data_in) and data_in is not None:
-            raise ValueError('The data_in parameter must be a sequence type with at least one item.')
+        if data_in is not None:
+            data = to_uint8_array(data_in)
+            if data is None:
+                raise ValueError('The data_in parameter must be a sequence type with at least one item.')
 
         if not is_bool(output):
             raise ValueError('The output parameter must be a boolean value.')
 
-        code = ctypes.c_uint8(code)
-        length = ctypes.c_uint32(length)
-        data_in = (ctypes.c_uint8 * (length.value - 1))(*data_in) if data_in is not None else None
-        data_out = (ctypes.c_uint8 * (length.value - 1))() if output else None
+        if data_in is not None:
+            if len(data) > length - 1:
+                raise ValueError('The data_in parameter must not hold more than length - 1 items.')
+            data_in = (_u8 * (length - 1))()
+            ctypes.memmove(data_in, data, len(data))
+        data_out = (_u8 * (length - 1))() if output else None
 
-        result = self._lib.NRFJPROG_qspi_custom_inst(self._handle,  code, length,
-                               ctypes.byref(data_in) if data_in is not None else None,
-                               ctypes.byref(data_out) if data_out is not None else None)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_qspi_custom_inst(self._handle,  code, length, data_in, data_out))
 
         if output:
             return bytearray(data_out)
@@ -1621,10 +1502,8 @@ class API(object):
 
         @param Path file_path : Path to file to program.
         """
-        file_path = str(file_path).encode('utf-8')
-        result = self._lib.NRFJPROG_program_file_inst(self._handle, file_path)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        file_path = encode_path(file_path)
+        self._check(self._lib.NRFJPROG_program_file_inst(self._handle, file_path))
 
     def read_to_file(self, file_path, read_options=None):
         """
@@ -1635,15 +1514,13 @@ class API(object):
         @param Path file_path: Path to store output.
         @param Parameters.ReadOptions read_options: Types of memories to read.
         """
-        file_path = str(file_path).encode('utf-8')
+        file_path = encode_path(file_path)
         if read_options is None:
             read_options = Parameters.ReadOptions(readcode=True)
         if not isinstance(read_options, ReadOptions):
             raise TypeError('The program_options parameter must be an instance of class ReadOptions.')
 
-        result = self._lib.NRFJPROG_read_to_file_inst(self._handle, file_path, read_options)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_read_to_file_inst(self._handle, file_path, read_options))
 
     def verify_file(self, file_path, verify_action=VerifyAction.VERIFY_READ):
         """
@@ -1657,13 +1534,9 @@ class API(object):
         if not isinstance(verify_action, VerifyAction):
             raise TypeError('Parameter verify_action must be of type int, str or VerifyAction enumeration.')
 
-        verify_action = ctypes.c_int(decode_enum(verify_action, VerifyAction))
-
-        file_path = str(file_path).encode('utf-8')
+        file_path = encode_path(file_path)
 
-        result = self._lib.NRFJPROG_verify_file_inst(self._handle, file_path, verify_action)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_verify_file_inst(self._handle, file_path, verify_action))
 
     def erase_file(self, file_path, chip_erase_mode=EraseAction.ERASE_ALL, qspi_erase_mode=EraseAction.ERASE_NONE):
         """
@@ -1680,13 +1553,9 @@ class API(object):
         if not isinstance(qspi_erase_mode, EraseAction):
             raise TypeError('Parameter erase_action must be of type int, str or EraseAction enumeration.')
 
-        file_path = str(file_path).encode('utf-8')
-        chip_erase_mode = ctypes.c_int(decode_enum(chip_erase_mode, EraseAction))
-        qspi_erase_mode = ctypes.c_int(decode_enum(qspi_erase_mode, EraseAction))
+        file_path = encode_path(file_path)
 
-        result = self._lib.NRFJPROG_erase_file_inst(self._handle, file_path, chip_erase_mode, qspi_erase_mode)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_erase_file_inst(self._handle, file_path, chip_erase_mode, qspi_erase_mode))
 
     # if colored(INTERNAL)
     def masserase(self):
@@ -1694,9 +1563,7 @@ class API(object):
         Erases all flash, including the info pages.
 
         """
-        result = self._lib.NRFJPROG_masserase_inst(self._handle)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_masserase_inst(self._handle))
 
     def ficrwrite_u32(self, addr, data):
         """
@@ -1711,12 +1578,7 @@ class API(object):
         if not is_u32(data):
             raise ValueError('The data parameter must be an unsigned 32-bit value.')
 
-        addr = ctypes.c_uint32(addr)
-        data = ctypes.c_uint32(data)
-
-        result = self._lib.NRFJPROG_ficrwrite_u32_inst(self._handle,  addr, data)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_ficrwrite_u32_inst(self._handle,  addr, data))
 
     def ficrwrite(self, addr, data):
         """
@@ -1728,16 +1590,13 @@ class API(object):
         if not is_u32(addr):
             raise ValueError('The addr parameter must be an unsigned 32-bit value.')
 
-        if not is_valid_buf(data):
+        data = to_uint8_array(data)
+        if data is None:
             raise ValueError('The data parameter must be a tuple or a list with at least one item.')
 
-        addr = ctypes.c_uint32(addr)
-        data_len = ctypes.c_uint32(len(data))
-        data = (ctypes.c_uint8 * data_len.value)(*data)
+        data_len = len(data)
 
-        result = self._lib.NRFJPROG_ficrwrite_inst(self._handle,  addr, ctypes.byref(data), data_len)
-        if result != NrfjprogdllErr.SUCCESS:
-            raise APIError(result, error_data=self.get_errors())
+        self._check(self._lib.NRFJPROG_ficrwrite_inst(self._handle,  addr, data, data_len))
 
     # endif /* colored(INTERNAL) */
 
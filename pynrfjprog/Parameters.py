@@ -2,12 +2,17 @@
 from __future__ import print_function
 
 import logging
+import itertools
 import time
+import weakref
 from builtins import int
 
+import array
 import enum
 import ctypes
 import codecs
+import collections.abc
+import os
 import sys
 import datetime
 
@@ -33,6 +38,24 @@ def decode_string(string):
 #                                                                                 #
 ###################################################################################
 
+# msg_callback_ex from DllCommonDefinitions.h, created once rather than for every LoggerAdapter.
+_MSG_CALLBACK_EX = ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_void_p)
+
+# LoggerAdapters receiving DLL log messages, keyed by the log_param they hand to the DLL along with _LOG_CALLBACK.
+_LOG_ADAPTERS = weakref.WeakValueDictionary()
+_LOG_PARAMS = itertools.count(1)
+
+
+def _dispatch_log_callback(logger_name, level, msg_str, instance):
+    adapter = _LOG_ADAPTERS.get(instance)
+    if adapter is not None:
+        adapter._log_callback(logger_name, level, msg_str, instance)
+
+
+# A single trampoline shared by all LoggerAdapters, so creating an API or a probe does not allocate a libffi closure.
+_LOG_CALLBACK = _MSG_CALLBACK_EX(_dispatch_log_callback)
+
+
 class CallbackHandler(logging.Handler):
     def __init__(self, callback):
         super(CallbackHandler, self).__init__()
@@ -60,6 +83,7 @@ class LoggerAdapter(logging.LoggerAdapter):
         super(LoggerAdapter, self).__init__(logger, id)
 
         self.log_cb = None
+        self.log_param = None
         self.error_handler = ErrorHandler()
         self.logger.addHandler(self.error_handler)
 
@@ -89,15 +113,21 @@ class LoggerAdapter(logging.LoggerAdapter):
                 for handler in self.logger.handlers:
                     handler.setFormatter(formatter)
 
-            self.log_cb = ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_void_p)\
-                (
-                    lambda logger_name, level, msg_str, instance:
-                        self.log_function(decode_string(logger_name).strip(), level, decode_string(msg_str).strip())
-                )
+            # Pass log_param along with log_cb to the DLL, it routes the messages back to this adapter.
+            self.log_param = next(_LOG_PARAMS)
+            _LOG_ADAPTERS[self.log_param] = self
+            self.log_cb = _LOG_CALLBACK
 
     def set_id(self, id):
         self.extra = id
 
+    def _log_callback(self, logger_name, level, msg_str, instance):
+        # Drop messages the logger would discard before decoding them. isEnabledFor is cached by the logging module
+        # and follows level changes made after the callback was handed to the DLL.
+        if not self.isEnabledFor(NrfjrpogdllLogLevel.get_level_from_value(level)):
+            return
+        self.log_function(decode_string(logger_name).strip(), level, decode_string(msg_str).strip())
+
     def log_function(self, logger_name, level, msg_str):
         msg = f"[{logger_name}] {msg_str}"
         self.log(NrfjrpogdllLogLevel.get_level_from_value(level), msg)
@@ -134,12 +164,7 @@ def is_bool(value):
 
 
 def is_valid_buf(buf):
-    if buf is None:
-        return False
-    for value in buf:
-        if not is_u8(value):
-            return False
-    return len(buf) > 0
+    return to_uint8_array(buf) is not None
 
 
 def is_valid_encoding(encoding):
@@ -154,10 +179,10 @@ def is_valid_encoding(encoding):
 def is_enum(param, enum_type):
     if isinstance(param, enum_type):
         return True
-    if isinstance(param, int) and param in [member for name, member in enum_type.__members__.items()]:
-        return True
-    elif isinstance(param, str) and param in [name for name, member in enum_type.__members__.items()]:
-        return True
+    if isinstance(param, int):
+        return param in enum_type._value2member_map_
+    elif isinstance(param, str):
+        return param in enum_type.__members__
     return False
 
 
@@ -168,15 +193,173 @@ def is_right_class(instance, class_type):
 
 
 def decode_enum(param, enum_type):
-    if not is_enum(param, enum_type):
-        return None
-
+    if isinstance(param, enum_type):
+        return param
     if isinstance(param, int):
-        return enum_type(param)
+        return enum_type._value2member_map_.get(param)
     elif isinstance(param, str):
-        return enum_type[param]
+        return enum_type.__members__.get(param)
+    return None
+
+
+def encode_path(path):
+    """
+    Encodes a file path or serial port name for the DLL as UTF-8. Accepts str, bytes and os.PathLike objects, bytes
+    are passed as is. Other objects are converted with str().
+    """
+    if isinstance(path, os.PathLike):
+        path = os.fspath(path)
+    if isinstance(path, bytes):
+        return path
+    return str(path).encode('utf-8')
+
+
+def encode_rtt_message(msg, encoding):
+    """
+    Converts an RTT message into the data passed to the DLL. str messages are encoded with encoding, other messages
+    are taken as a sequence of uint8 values when encoding is None or empty.
+
+    @return bytes or ctypes array: The data to write, or None if the message is empty.
+    """
+    # bytes objects are passed to the DLL without copying, and bytearrays are shared through from_buffer.
+    # bytes() rejects values outside of 0-255 itself, only emptiness is left to check.
+    if encoding:
+        data = msg.encode(encoding)
+    elif isinstance(msg, bytearray):
+        data = (ctypes.c_char * len(msg)).from_buffer(msg)
     else:
-        return param
+        data = bytes(msg)
+    return data if len(data) > 0 else None
+
+
+def decode_rtt_data(data, length, encoding):
+    """
+    Gets the first length bytes of an RTT read buffer, as a str decoded with encoding or as a bytearray if encoding is None.
+    """
+    # Both bytearray() and str() read straight from a view of the buffer, copying the data only once.
+    received = memoryview(data).cast('B')[:length]
+    if encoding is None:
+        return bytearray(received)
+    else:
+        return str(received, encoding)
+
+
+def to_uint8_array(data):
+    """
+    Validates a sequence of uint8 values and converts it into a ctypes c_uint8 array in a single pass.
+
+    bytearray objects and other writable byte buffers are shared with the returned array instead of being copied.
+    Iterators and generators are rejected, as they have no length and would be consumed by the check.
+
+    @return ctypes array: The converted data, or None if data is not a sequence of uint8 values with at least one item.
+    """
+    if isinstance(data, bytearray):
+        return (ctypes.c_uint8 * len(data)).from_buffer(data) if data else None
+    if isinstance(data, bytes):
+        return (ctypes.c_uint8 * len(data)).from_buffer_copy(data) if data else None
+
+    try:
+        view = memoryview(data)
+    except TypeError:
+        view = None
+    if view is not None:
+        # Multi-dimensional buffers do not hold a flat sequence of values.
+        if view.ndim != 1:
+            return None
+        if view.format == 'B' and view.c_contiguous:
+            if view.nbytes == 0:
+                return None
+            if view.readonly:
+                return (ctypes.c_uint8 * view.nbytes).from_buffer_copy(view)
+            return (ctypes.c_uint8 * view.nbytes).from_buffer(view)
+
+    if not isinstance(data, collections.abc.Sized):
+        return None
+
+    # Packing into an array range checks every item in C, instead of calling is_u8 once per item.
+    try:
+        buf = array.array('B', data)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if len(buf) == 0:
+        return None
+    return (ctypes.c_uint8 * len(buf)).from_buffer(buf)
+
+
+def to_uint8_view(buf):
+    """
+    Gets a ctypes c_uint8 array sharing the memory of buf, so that the DLL reads straight into it.
+
+    @return ctypes array: The shared array, or None if buf is not a writable, C-contiguous buffer of at most 0xFFFFFFFF bytes.
+    """
+    try:
+        view = memoryview(buf).cast('B')
+    except TypeError:
+        return None
+    if view.readonly or not is_u32(view.nbytes):
+        return None
+    return (ctypes.c_uint8 * view.nbytes).from_buffer(view)
+
+
+# array.array typecode of a 32-bit unsigned integer on this platform, used to pack word buffers for the DLL.
+_U32_TYPECODE = 'I' if array.array('I').itemsize == 4 else 'L'
+
+
+def to_uint32_array(values):
+    """
+    Packs a sequence of unsigned 32-bit values into a word buffer for the DLL, in the little-endian byte order of the
+    device. bytes, bytearray and str are rejected rather than reinterpreted as raw words.
+
+    @return array.array: The packed values, or None if values is not a sequence of unsigned 32-bit values with at least one item.
+    """
+    if values is None or isinstance(values, (str, bytes, bytearray)):
+        return None
+    try:
+        words = array.array(_U32_TYPECODE, values)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if len(words) == 0:
+        return None
+
+    if sys.byteorder != 'little':
+        words.byteswap()
+    return words
+
+
+def new_uint32_array(word_count):
+    """ Allocates a zeroed word buffer for word_count values read from the DLL. Byte swap it on big-endian hosts. """
+    return array.array(_U32_TYPECODE, [0]) * word_count
+
+
+_LIB_CACHE = {}
+
+
+def load_library(path, prototypes, restypes=None):
+    """
+    Loads the DLL at path and sets argtypes and restype of the functions in prototypes. Libraries are cached by path,
+    so each is loaded and declared once and shared by all API instances.
+
+    @param str path: Path or name of the DLL to load.
+    @param dict prototypes: Function names mapped to their argtypes. Functions return a c_int error code.
+    @param (optional) dict restypes: Function names mapped to a restype other than c_int.
+    @return CDLL: The loaded library.
+    """
+    lib = _LIB_CACHE.get(path)
+    if lib is None:
+        # CDLL, unlike PyDLL, releases the GIL for the duration of every call. Long running operations such as
+        # programming or RTT polling therefore do not block other Python threads.
+        lib = ctypes.CDLL(path)
+        restypes = restypes or {}
+        for name, argtypes in prototypes.items():
+            try:
+                function = getattr(lib, name)
+            except AttributeError:
+                # Symbol not exported by this DLL, calling it fails as it did before.
+                continue
+            function.argtypes = argtypes
+            function.restype = restypes.get(name, ctypes.c_int)
+        _LIB_CACHE[path] = lib
+    return lib
 
 
 @enum.unique
@@ -401,22 +584,19 @@ class NrfjrpogdllLogLevel(enum.IntEnum):
 
     @staticmethod
     def get_level_from_value(level):
-        if level == NrfjrpogdllLogLevel.critical:
-            return logging.CRITICAL
-        elif level == NrfjrpogdllLogLevel.error:
-            return logging.ERROR
-        elif level == NrfjrpogdllLogLevel.warning:
-            return logging.WARNING
-        elif level == NrfjrpogdllLogLevel.info:
-            return logging.INFO
-        elif level == NrfjrpogdllLogLevel.debug:
-            return logging.DEBUG
-        elif level == NrfjrpogdllLogLevel.trace:
-            return logging.DEBUG
-        elif level == NrfjrpogdllLogLevel.none:
-            return logging.NOTSET
-        else:
-            return logging.NOTSET
+        return _LOGGING_LEVELS.get(level, logging.NOTSET)
+
+
+# Python logging level for each nrfjprogdll_log_level, looked up for every message logged by the DLL.
+_LOGGING_LEVELS = {
+    NrfjrpogdllLogLevel.critical.value: logging.CRITICAL,
+    NrfjrpogdllLogLevel.error.value:    logging.ERROR,
+    NrfjrpogdllLogLevel.warning.value:  logging.WARNING,
+    NrfjrpogdllLogLevel.info.value:     logging.INFO,
+    NrfjrpogdllLogLevel.debug.value:    logging.DEBUG,
+    NrfjrpogdllLogLevel.trace.value:    logging.DEBUG,
+    NrfjrpogdllLogLevel.none.value:     logging.NOTSET,
+}
 
 
 ###################################################################################